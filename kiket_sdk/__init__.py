@@ -1,59 +1,92 @@
-"""Kiket Python SDK public interface."""
-
-from .auth import AuthContext
-from .client import KiketClient
-from .config import ExtensionConfig
-from .custom_data import ExtensionCustomDataClient
-from .endpoints import ExtensionEndpoints, RateLimitInfo
-from .intake_forms import IntakeFormsClient
-from .notifications import (
-    ChannelValidationRequest,
-    ChannelValidationResponse,
-    NotificationRequest,
-    NotificationResponse,
-)
-from .responses import (
-    AllowResponse,
-    DenyResponse,
-    PendingResponse,
-    Response,
-    allow,
-    deny,
-    pending,
-)
-from .routing import webhook
-from .sdk import HandlerContext, KiketSDK, create_app
-from .secrets import ExtensionSecretManager, SecretMetadata, SecretValue
-from .sla import ExtensionSlaEventsClient
-from .telemetry import TelemetryRecord
-
-__all__ = [
-    "KiketSDK",
-    "create_app",
-    "HandlerContext",
-    "AuthContext",
-    "webhook",
-    "KiketClient",
-    "ExtensionConfig",
-    "ExtensionEndpoints",
-    "RateLimitInfo",
-    "ExtensionCustomDataClient",
-    "ExtensionSlaEventsClient",
-    "IntakeFormsClient",
-    "ExtensionSecretManager",
-    "SecretMetadata",
-    "SecretValue",
-    "TelemetryRecord",
-    "NotificationRequest",
-    "NotificationResponse",
-    "ChannelValidationRequest",
-    "ChannelValidationResponse",
+"""Kiket Python SDK public interface.
+
+Public names are resolved lazily on first attribute access (PEP 562) so that
+``import kiket_sdk`` does not pull in FastAPI, httpx, or PyJWT until a symbol
+that needs them is actually used.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from .auth import AuthContext
+    from .client import KiketClient
+    from .config import ExtensionConfig
+    from .custom_data import ExtensionCustomDataClient
+    from .endpoints import ExtensionEndpoints, RateLimitInfo
+    from .intake_forms import IntakeFormsClient
+    from .notifications import (
+        ChannelValidationRequest,
+        ChannelValidationResponse,
+        NotificationRequest,
+        NotificationResponse,
+    )
+    from .responses import (
+        AllowResponse,
+        DenyResponse,
+        PendingResponse,
+        Response,
+        allow,
+        deny,
+        pending,
+    )
+    from .routing import webhook
+    from .sdk import HandlerContext, KiketSDK, create_app
+    from .secrets import ExtensionSecretManager, SecretMetadata, SecretValue
+    from .sla import ExtensionSlaEventsClient
+    from .telemetry import TelemetryRecord
+
+# Public name -> (submodule, attribute). ``None`` as the attribute exposes the submodule itself.
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "KiketSDK": ("sdk", "KiketSDK"),
+    "create_app": ("sdk", "create_app"),
+    "HandlerContext": ("sdk", "HandlerContext"),
+    "AuthContext": ("auth", "AuthContext"),
+    "webhook": ("routing", "webhook"),
+    "KiketClient": ("client", "KiketClient"),
+    "ExtensionConfig": ("config", "ExtensionConfig"),
+    "ExtensionEndpoints": ("endpoints", "ExtensionEndpoints"),
+    "RateLimitInfo": ("endpoints", "RateLimitInfo"),
+    "ExtensionCustomDataClient": ("custom_data", "ExtensionCustomDataClient"),
+    "ExtensionSlaEventsClient": ("sla", "ExtensionSlaEventsClient"),
+    "IntakeFormsClient": ("intake_forms", "IntakeFormsClient"),
+    "ExtensionSecretManager": ("secrets", "ExtensionSecretManager"),
+    "SecretMetadata": ("secrets", "SecretMetadata"),
+    "SecretValue": ("secrets", "SecretValue"),
+    "TelemetryRecord": ("telemetry", "TelemetryRecord"),
+    "NotificationRequest": ("notifications", "NotificationRequest"),
+    "NotificationResponse": ("notifications", "NotificationResponse"),
+    "ChannelValidationRequest": ("notifications", "ChannelValidationRequest"),
+    "ChannelValidationResponse": ("notifications", "ChannelValidationResponse"),
     # Response helpers
-    "Response",
-    "AllowResponse",
-    "DenyResponse",
-    "PendingResponse",
-    "allow",
-    "deny",
-    "pending",
-]
+    "Response": ("responses", "Response"),
+    "AllowResponse": ("responses", "AllowResponse"),
+    "DenyResponse": ("responses", "DenyResponse"),
+    "PendingResponse": ("responses", "PendingResponse"),
+    "allow": ("responses", "allow"),
+    "deny": ("responses", "deny"),
+    "pending": ("responses", "pending"),
+}
+
+# Every public name is lazy, so the export list is derived from the table above.
+__all__ = [*_LAZY_IMPORTS]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, attr) if attr else module
+    # Cache on the package so subsequent lookups bypass __getattr__ entirely.
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
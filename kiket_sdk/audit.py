@@ -1,13 +1,16 @@
 """Helpers for blockchain audit verification via the Kiket API."""
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from .exceptions import AuditVerificationError, OutboundRequestError
+from .utils import json_loads
 
 if TYPE_CHECKING:  # pragma: no cover - import for typing only
     from .client import KiketClient
@@ -16,13 +19,52 @@ if TYPE_CHECKING:  # pragma: no cover - import for typing only
 def _parse_timestamp(value: str | None) -> datetime | None:
     if not value:
         return None
+    return _parse_iso_timestamp(value)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_iso_timestamp(value: str) -> datetime | None:
+    # Anchor pages repeat the same timestamps across records; datetimes are immutable,
+    # so sharing cached instances is safe. Python 3.11+ parses a trailing "Z" natively.
     try:
-        sanitized = value.replace("Z", "+00:00")
-        return datetime.fromisoformat(sanitized)
+        return datetime.fromisoformat(value)
     except ValueError:
         return None
 
 
+_EMPTY_SHA256 = hashlib.sha256()
+
+
+def _canonicalize(data: dict[str, Any]) -> str:
+    # sort_keys already orders nested objects; no need to pre-sort the top level.
+    return json.dumps(data, separators=(",", ":"), sort_keys=True)
+
+
+def _digest_of(canonical: str) -> str:
+    return f"0x{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+def _normalize_hash(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def _fold_proof(leaf: bytes, siblings: list[bytes]) -> bytes:
+    # Hot loop for local verification: the pair hash is inlined and the hasher factory
+    # bound once, so each level costs one sha256 copy and no extra Python frames.
+    # Pairs are hashed in sorted order, so the leaf's left/right position never changes
+    # the result and a single comparison per level picks the order.
+    new_hasher = _EMPTY_SHA256.copy
+    current = leaf
+    for sibling in siblings:
+        lo, hi = (current, sibling) if current <= sibling else (sibling, current)
+        # Two updates feed the same compressor without allocating lo + hi.
+        hasher = new_hasher()
+        hasher.update(lo)
+        hasher.update(hi)
+        current = hasher.digest()
+    return current
+
+
 @dataclass(slots=True)
 class BlockchainAnchor:
     """Represents a blockchain anchor containing a batch of audit records."""
@@ -79,6 +121,27 @@ class VerificationResult:
     error: str | None = None
 
 
+# BlockchainAnchor field -> default used when the API omits it (see _parse_anchor).
+_ANCHOR_COLUMNS: dict[str, Any] = {
+    "id": 0,
+    "merkle_root": "",
+    "leaf_count": 0,
+    "first_record_at": None,
+    "last_record_at": None,
+    "network": "",
+    "status": "",
+    "tx_hash": None,
+    "block_number": None,
+    "block_timestamp": None,
+    "confirmed_at": None,
+    "explorer_url": None,
+    "created_at": None,
+}
+_ANCHOR_TIMESTAMP_COLUMNS = frozenset(
+    {"first_record_at", "last_record_at", "block_timestamp", "confirmed_at", "created_at"}
+)
+
+
 class AuditClient:
     """Client for blockchain audit verification operations."""
 
@@ -108,6 +171,83 @@ class AuditClient:
         Returns:
             Tuple of (list of anchors, pagination info)
         """
+        data = await self._fetch_anchor_page(
+            status=status,
+            network=network,
+            from_date=from_date,
+            to_date=to_date,
+            page=page,
+            per_page=per_page,
+        )
+        anchors = [self._parse_anchor(a) for a in data.get("anchors", [])]
+        pagination = data.get("pagination", {})
+
+        return anchors, pagination
+
+    async def list_anchors_columns(
+        self,
+        *,
+        columns: Iterable[str] | None = None,
+        status: str | None = None,
+        network: str | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        page: int = 1,
+        per_page: int = 25,
+    ) -> tuple[dict[str, list[Any]], dict[str, Any]]:
+        """List blockchain anchors as columns instead of BlockchainAnchor objects.
+
+        Only the requested columns are materialized, which is cheaper than
+        :meth:`list_anchors` when a handler needs a few fields (for example just
+        the merkle roots) from a large page.
+
+        Args:
+            columns: BlockchainAnchor field names to return (all fields when omitted)
+            status: Filter by status (pending, submitted, confirmed, failed)
+            network: Filter by network (polygon_amoy, polygon_mainnet)
+            from_date: Filter anchors created after this date
+            to_date: Filter anchors created before this date
+            page: Page number (1-indexed)
+            per_page: Results per page (max 100)
+
+        Returns:
+            Tuple of (mapping of field name to per-anchor values, pagination info)
+        """
+        selected = tuple(columns) if columns is not None else tuple(_ANCHOR_COLUMNS)
+        unknown = [name for name in selected if name not in _ANCHOR_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown anchor columns: {', '.join(unknown)}")
+
+        data = await self._fetch_anchor_page(
+            status=status,
+            network=network,
+            from_date=from_date,
+            to_date=to_date,
+            page=page,
+            per_page=per_page,
+        )
+        raw = data.get("anchors", [])
+
+        result: dict[str, list[Any]] = {}
+        for name in selected:
+            default = _ANCHOR_COLUMNS[name]
+            if name in _ANCHOR_TIMESTAMP_COLUMNS:
+                result[name] = [_parse_timestamp(a.get(name)) for a in raw]
+            else:
+                result[name] = [a.get(name, default) for a in raw]
+
+        return result, data.get("pagination", {})
+
+    async def _fetch_anchor_page(
+        self,
+        *,
+        status: str | None,
+        network: str | None,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        page: int,
+        per_page: int,
+    ) -> dict[str, Any]:
         params: dict[str, Any] = {"page": page, "per_page": per_page}
         if status:
             params["status"] = status
@@ -123,11 +263,7 @@ class AuditClient:
         except OutboundRequestError as exc:
             raise AuditVerificationError("Failed to list anchors") from exc
 
-        data = response.json()
-        anchors = [self._parse_anchor(a) for a in data.get("anchors", [])]
-        pagination = data.get("pagination", {})
-
-        return anchors, pagination
+        return cast(dict[str, Any], json_loads(response.content))
 
     async def get_anchor(self, merkle_root: str, *, include_records: bool = False) -> BlockchainAnchor:
         """Get details of a specific anchor by merkle root.
@@ -146,7 +282,7 @@ class AuditClient:
         except OutboundRequestError as exc:
             raise AuditVerificationError(f"Failed to get anchor {merkle_root}") from exc
 
-        return self._parse_anchor(response.json())
+        return self._parse_anchor(json_loads(response.content))
 
     async def get_proof(
         self,
@@ -173,7 +309,7 @@ class AuditClient:
         except OutboundRequestError as exc:
             raise AuditVerificationError(f"Failed to get proof for record {record_id}") from exc
 
-        return self._parse_proof(response.json())
+        return self._parse_proof(json_loads(response.content))
 
     async def verify(self, proof: BlockchainProof | dict[str, Any]) -> VerificationResult:
         """Verify a blockchain proof.
@@ -200,7 +336,7 @@ class AuditClient:
         except OutboundRequestError as exc:
             raise AuditVerificationError("Verification request failed") from exc
 
-        data = response.json()
+        data = json_loads(response.content)
         return VerificationResult(
             verified=data.get("verified", False),
             proof_valid=data.get("proof_valid", False),
@@ -225,9 +361,36 @@ class AuditClient:
         Returns:
             Hex string with 0x prefix
         """
-        canonical = json.dumps(dict(sorted(data.items())), separators=(",", ":"), sort_keys=True)
-        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
-        return f"0x{digest}"
+        return _digest_of(_canonicalize(data))
+
+    @staticmethod
+    def compute_content_hashes(records: Iterable[dict[str, Any]]) -> list[str]:
+        """Compute content hashes for many records in one call.
+
+        Args:
+            records: Record data dicts
+
+        Returns:
+            Hex strings with 0x prefix, in input order
+        """
+        canonicalize = _canonicalize
+        digest_of = _digest_of
+        return [digest_of(canonicalize(record)) for record in records]
+
+    @staticmethod
+    def compute_content_hash_bytes(data: dict[str, Any]) -> bytes:
+        """Compute the raw 32-byte content hash for a record.
+
+        Useful when building or checking Merkle trees locally, which operate on
+        bytes and would otherwise round-trip through the hex form.
+
+        Args:
+            data: Record data dict
+
+        Returns:
+            SHA-256 digest bytes
+        """
+        return hashlib.sha256(_canonicalize(data).encode("utf-8")).digest()
 
     @staticmethod
     def verify_proof_locally(
@@ -241,35 +404,54 @@ class AuditClient:
         Args:
             content_hash: Hash of the record content
             proof_path: Array of sibling hashes
-            leaf_index: Position of the leaf in the tree
+            leaf_index: Position of the leaf in the tree (pairs are hashed in sorted
+                order, so the result does not depend on it)
             merkle_root: Expected root hash
 
         Returns:
             True if the proof is valid
         """
+        siblings = [_normalize_hash(sibling_hex) for sibling_hex in proof_path]
+        computed = _fold_proof(_normalize_hash(content_hash), siblings)
+        return computed == _normalize_hash(merkle_root)
 
-        def normalize_hash(h: str) -> bytes:
-            hex_str = h[2:] if h.startswith("0x") else h
-            return bytes.fromhex(hex_str)
-
-        def hash_pair(left: bytes, right: bytes) -> bytes:
-            if left > right:
-                left, right = right, left
-            return hashlib.sha256(left + right).digest()
-
-        current = normalize_hash(content_hash)
-        idx = leaf_index
+    @staticmethod
+    def verify_proofs_batch(
+        content_hashes: list[str],
+        proof_paths: list[list[str]],
+        merkle_roots: list[str],
+    ) -> list[bool]:
+        """Verify many Merkle proofs locally in one call.
+
+        All hex inputs are decoded up front so the hashing loop only touches
+        bytes. ``hashlib`` delegates to OpenSSL, which uses the CPU's SHA
+        extensions when available and falls back to its software implementation
+        otherwise.
+
+        Unlike :meth:`verify_proof_locally` there are no leaf indices to pass:
+        pairs are hashed in sorted order, so a leaf's position never affects
+        the result.
 
-        for sibling_hex in proof_path:
-            sibling = normalize_hash(sibling_hex)
-            if idx % 2 == 0:
-                current = hash_pair(current, sibling)
-            else:
-                current = hash_pair(sibling, current)
-            idx //= 2
+        Args:
+            content_hashes: Hash of each record's content
+            proof_paths: Sibling hashes for each record
+            merkle_roots: Expected root hash for each record
 
-        expected = normalize_hash(merkle_root)
-        return current == expected
+        Returns:
+            One boolean per record, True where the proof is valid
+        """
+        count = len(content_hashes)
+        if not count == len(proof_paths) == len(merkle_roots):
+            raise ValueError("content_hashes, proof_paths and merkle_roots must have the same length")
+
+        leaves = [_normalize_hash(h) for h in content_hashes]
+        siblings = [[_normalize_hash(h) for h in path] for path in proof_paths]
+        roots = [_normalize_hash(h) for h in merkle_roots]
+
+        return [
+            _fold_proof(leaves[i], siblings[i]) == roots[i]
+            for i in range(count)
+        ]
 
     def _parse_anchor(self, data: dict[str, Any]) -> BlockchainAnchor:
         return BlockchainAnchor(
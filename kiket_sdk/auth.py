@@ -1,23 +1,63 @@
 """JWT authentication utilities for webhook verification."""
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import logging
+import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
-
-import httpx
-import jwt
-from jwt import PyJWKClient
-from jwt.exceptions import ExpiredSignatureError, InvalidIssuerError, PyJWTError
+from typing import TYPE_CHECKING, Any
 
 from .exceptions import AuthenticationError
 
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    import httpx
+    from jwt import PyJWKClient
+
+# httpx and PyJWT (which drags in cryptography) are imported inside the functions that
+# need them, so importing AuthContext/JwtPayload stays cheap.
+
+logger = logging.getLogger(__name__)
+
+
+def _env_seconds(name: str, default: float) -> float:
+    """Read a non-negative duration in seconds from ``name``, falling back to ``default``."""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = -1.0
+    if not value >= 0:  # also rejects NaN
+        logger.warning("Ignoring invalid %s=%r; using %s seconds", name, raw, default)
+        return default
+    return value
+
+
 ALGORITHM = "ES256"
 ISSUER = "kiket.dev"
-JWKS_CACHE_TTL = 3600  # 1 hour
+JWKS_CACHE_TTL = _env_seconds("KIKET_JWKS_TTL", 3600.0)  # 1 hour by default
+# Verified runtime tokens are reused for this many seconds (never past their own exp).
+# Set KIKET_JWT_CACHE_TTL=0 to verify every request.
+JWT_CACHE_TTL = _env_seconds("KIKET_JWT_CACHE_TTL", 55.0)
+JWT_CACHE_SIZE = 1024
+JWT_EXPIRY_LEEWAY = 5
 
-_jwks_cache: dict[str, tuple[PyJWKClient, float]] = {}
+# base_url -> (in-flight or completed JWKS fetch, monotonic expiry). Concurrent callers
+# await the same task, so a cold-start burst triggers a single fetch.
+_jwks_cache: dict[str, tuple[asyncio.Task[PyJWKClient], float]] = {}
+
+# (base_url, token digest) -> (verified payload, wall-clock expiry), in LRU order.
+_token_cache: OrderedDict[tuple[str, bytes], tuple[JwtPayload, float]] = OrderedDict()
+
+# Shared across JWKS refreshes so repeated fetches reuse pooled keep-alive connections.
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
 
 
 @dataclass
@@ -76,7 +116,35 @@ async def verify_runtime_token(payload: dict[str, Any], base_url: str) -> JwtPay
     if not token:
         raise AuthenticationError("Missing runtime_token in payload")
 
-    return await decode_jwt(token, base_url)
+    # Reject tokens that cannot be a compact JWS before hashing, fetching JWKS or hopping to
+    # the executor, so a flood of garbage tokens stays O(1) per request.
+    if not isinstance(token, str) or token.count(".") != 2:
+        raise AuthenticationError("Invalid token: not a compact JWT")
+
+    if JWT_CACHE_TTL <= 0:
+        return await decode_jwt(token, base_url)
+    return await _decode_jwt_cached(token, base_url)
+
+
+async def _decode_jwt_cached(token: str, base_url: str) -> JwtPayload:
+    # Key on a digest so the cache does not keep every bearer token alive in memory.
+    key = (base_url, hashlib.blake2b(token.encode(), digest_size=16).digest())
+    cached = _token_cache.get(key)
+    if cached is not None:
+        if time.time() < cached[1]:
+            _token_cache.move_to_end(key)
+            return cached[0]
+        del _token_cache[key]
+
+    decoded = await decode_jwt(token, base_url)
+
+    expires_at = time.time() + JWT_CACHE_TTL
+    if decoded.exp:
+        expires_at = min(expires_at, decoded.exp - JWT_EXPIRY_LEEWAY)
+    _token_cache[key] = (decoded, expires_at)
+    if len(_token_cache) > JWT_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return decoded
 
 
 async def decode_jwt(token: str, base_url: str) -> JwtPayload:
@@ -99,8 +167,19 @@ async def decode_jwt(token: str, base_url: str) -> JwtPayload:
     AuthenticationError:
         If the token is invalid.
     """
+    jwks_client = await _get_jwks_client(base_url)
+    # Signature verification (and PyJWKClient's blocking refresh on an unknown key id) runs
+    # in the default executor so a burst of uncached tokens does not stall the event loop.
+    return await asyncio.get_running_loop().run_in_executor(
+        None, _verify_signature, token, jwks_client
+    )
+
+
+def _verify_signature(token: str, jwks_client: PyJWKClient) -> JwtPayload:
+    import jwt
+    from jwt.exceptions import ExpiredSignatureError, InvalidIssuerError, PyJWTError
+
     try:
-        jwks_client = await _get_jwks_client(base_url)
         signing_key = jwks_client.get_signing_key_from_jwt(token)
 
         decoded = jwt.decode(
@@ -138,29 +217,84 @@ async def decode_jwt(token: str, base_url: str) -> JwtPayload:
 
 async def _get_jwks_client(base_url: str) -> PyJWKClient:
     """Get or create a cached JWKS client."""
-    now = time.time()
     cached = _jwks_cache.get(base_url)
+    # A fetch cancelled by loop teardown (e.g. the end of an asyncio.run) can never
+    # succeed, so it is replaced rather than served until the TTL runs out.
+    if cached is None or time.monotonic() >= cached[1] or cached[0].cancelled():
+        task = asyncio.ensure_future(_fetch_jwks_client(base_url))
+        cached = (task, time.monotonic() + JWKS_CACHE_TTL)
+        _jwks_cache[base_url] = cached
+
+    task = cached[0]
+    try:
+        # Shield so one cancelled request does not abort the fetch other callers await.
+        return await asyncio.shield(task)
+    except BaseException:
+        # Only evict when the fetch itself failed or was cancelled; a cancelled caller
+        # leaves the shielded fetch running for everyone else.
+        failed = task.done() and (task.cancelled() or task.exception() is not None)
+        if failed and _jwks_cache.get(base_url) is cached:
+            del _jwks_cache[base_url]
+        raise
 
-    if cached and (now - cached[1]) < JWKS_CACHE_TTL:
-        return cached[0]
 
-    jwks_url = f"{base_url.rstrip('/')}/.well-known/jwks.json"
+async def _fetch_jwks_client(base_url: str) -> PyJWKClient:
+    import httpx
+    from jwt import PyJWKClient
+    from jwt.exceptions import PyJWTError
+
+    jwks_url = _jwks_url(base_url)
 
     try:
-        # Fetch JWKS to verify it's available before creating client
-        async with httpx.AsyncClient() as client:
-            response = await client.get(jwks_url, timeout=10.0)
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
+        client = _get_http_client()
+        response = await client.get(jwks_url)
+        response.raise_for_status()
+        jwk_set = response.json()
+    except (httpx.HTTPError, ValueError) as exc:
         raise AuthenticationError(f"Failed to fetch JWKS: {exc}") from exc
 
-    # Create PyJWKClient with caching
-    jwks_client = PyJWKClient(jwks_url, cache_keys=True, lifespan=JWKS_CACHE_TTL)
-    _jwks_cache[base_url] = (jwks_client, now)
+    # Seed PyJWKClient with the keys we just fetched so it does not issue its own
+    # blocking request on first use. It still refreshes itself on unknown key ids.
+    jwks_client = PyJWKClient(jwks_url, cache_keys=True, lifespan=max(JWKS_CACHE_TTL, 1))
+    if jwks_client.jwk_set_cache is not None:
+        try:
+            jwks_client.jwk_set_cache.put(jwk_set)
+        except PyJWTError as exc:
+            raise AuthenticationError(f"Invalid JWKS payload: {exc}") from exc
 
     return jwks_client
 
 
+@functools.lru_cache(maxsize=64)
+def _jwks_url(base_url: str) -> str:
+    return f"{base_url.rstrip('/')}/.well-known/jwks.json"
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared JWKS HTTP client, creating it for the running event loop."""
+    import httpx
+
+    global _http_client, _http_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared JWKS HTTP client (call on application shutdown)."""
+    global _http_client, _http_client_loop
+
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
 def build_auth_context(jwt_payload: JwtPayload, raw_payload: dict[str, Any]) -> AuthContext:
     """Build authentication context from verified JWT payload.
 
@@ -186,7 +320,8 @@ def build_auth_context(jwt_payload: JwtPayload, raw_payload: dict[str, Any]) ->
         runtime_token=raw_auth.get("runtime_token", ""),
         token_type="runtime",
         expires_at=expires_at,
-        scopes=jwt_payload.scopes or [],
+        # Copy so handlers cannot mutate the payload shared through the token cache.
+        scopes=list(jwt_payload.scopes or ()),
         org_id=jwt_payload.org_id,
         ext_id=jwt_payload.ext_id,
         proj_id=jwt_payload.proj_id,
@@ -194,5 +329,6 @@ def build_auth_context(jwt_payload: JwtPayload, raw_payload: dict[str, Any]) ->
 
 
 def clear_jwks_cache() -> None:
-    """Clear the JWKS cache (useful for testing or key rotation)."""
+    """Clear the JWKS and verified-token caches (useful for testing or key rotation)."""
     _jwks_cache.clear()
+    _token_cache.clear()
@@ -8,6 +8,8 @@ import httpx
 
 from .exceptions import OutboundRequestError, SecretStoreError
 
+DEFAULT_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
 
 class KiketClient:
     """Async HTTP client that injects workspace token headers automatically."""
@@ -19,18 +21,42 @@ class KiketClient:
         runtime_token: str | None = None,
         *,
         timeout: float = 15.0,
+        limits: httpx.Limits | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.workspace_token = workspace_token
         self.runtime_token = runtime_token
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=timeout)
+        # Tokens are fixed per client, so the default headers are built once.
+        self._base_headers: dict[str, str] = {"Accept": "application/json"}
+        if workspace_token:
+            self._base_headers["Authorization"] = f"Bearer {workspace_token}"
+        if runtime_token:
+            self._base_headers["X-Kiket-Runtime-Token"] = runtime_token
+        # One pooled AsyncClient per KiketClient; every endpoint helper built on top of this
+        # client (custom data, intake forms, SLA events, secrets) shares its connections.
+        # A caller-supplied ``http_client`` (already bound to ``base_url``) is borrowed, not
+        # owned: it is left open on exit so its pool can outlive this wrapper.
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=limits or DEFAULT_POOL_LIMITS,
+        )
 
     async def __aenter__(self) -> KiketClient:
-        await self._client.__aenter__()
+        if self._owns_client:
+            await self._client.__aenter__()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        await self._client.__aexit__(*args)
+        if self._owns_client:
+            await self._client.__aexit__(*args)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool unless it was supplied by the caller."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
         try:
@@ -79,9 +105,6 @@ class KiketClient:
             raise SecretStoreError("Failed to delete extension secret") from exc
 
     def _build_headers(self, headers: Mapping[str, str]) -> Mapping[str, str]:
-        merged = {"Accept": "application/json", **headers}
-        if self.workspace_token:
-            merged.setdefault("Authorization", f"Bearer {self.workspace_token}")
-        if self.runtime_token:
-            merged.setdefault("X-Kiket-Runtime-Token", self.runtime_token)
-        return merged
+        if not headers:
+            return self._base_headers
+        return {**self._base_headers, **headers}
@@ -8,6 +8,7 @@ from typing import Any, cast
 from urllib.parse import quote
 
 from .client import KiketClient
+from .utils import json_loads
 
 
 class ExtensionCustomDataClient:
@@ -19,6 +20,7 @@ class ExtensionCustomDataClient:
 
         self._client = client
         self._project_id = project_id
+        self._project_params: Mapping[str, Any] = {"project_id": project_id}
 
     async def list(
         self,
@@ -32,14 +34,14 @@ class ExtensionCustomDataClient:
             self._path(module_key, table),
             params=self._base_params(limit=limit, filters=filters),
         )
-        return cast(Mapping[str, Any], response.json())
+        return cast(Mapping[str, Any], json_loads(response.content))
 
     async def get(self, module_key: str, table: str, record_id: str | int) -> Mapping[str, Any]:
         response = await self._client.get(
             self._path(module_key, table, record_id),
             params=self._base_params(),
         )
-        return cast(Mapping[str, Any], response.json())
+        return cast(Mapping[str, Any], json_loads(response.content))
 
     async def create(
         self, module_key: str, table: str, record: Mapping[str, Any]
@@ -49,7 +51,7 @@ class ExtensionCustomDataClient:
             params=self._base_params(),
             json={"record": record},
         )
-        return cast(Mapping[str, Any], response.json())
+        return cast(Mapping[str, Any], json_loads(response.content))
 
     async def update(
         self,
@@ -63,7 +65,7 @@ class ExtensionCustomDataClient:
             params=self._base_params(),
             json={"record": record},
         )
-        return cast(Mapping[str, Any], response.json())
+        return cast(Mapping[str, Any], json_loads(response.content))
 
     async def delete(self, module_key: str, table: str, record_id: str | int) -> None:
         await self._client.delete(
@@ -72,19 +74,20 @@ class ExtensionCustomDataClient:
         )
 
     def _path(self, module_key: str, table: str, record_id: str | int | None = None) -> str:
-        encoded_module = quote(module_key, safe="")
-        encoded_table = quote(table, safe="")
-        path = f"/api/v1/ext/custom_data/{encoded_module}/{encoded_table}"
+        prefix = f"/api/v1/ext/custom_data/{quote(module_key, safe='')}/{quote(table, safe='')}"
         if record_id is not None:
-            path += f"/{record_id}"
-        return path
+            return f"{prefix}/{record_id}"
+        return prefix
 
     def _base_params(
         self,
         *,
         limit: int | None = None,
         filters: Mapping[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> Mapping[str, Any]:
+        if limit is None and not filters:
+            # Shared read-only template; httpx copies query params, it never mutates them.
+            return self._project_params
         params: dict[str, Any] = {"project_id": self._project_id}
         if limit is not None:
             params["limit"] = limit
@@ -1,13 +1,19 @@
 """High-level client for Kiket extension endpoints."""
 from __future__ import annotations
 
-from typing import Any, TypedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, TypedDict, cast
 
 from .client import KiketClient
 from .custom_data import ExtensionCustomDataClient
 from .intake_forms import IntakeFormsClient
 from .secrets import ExtensionSecretManager
 from .sla import ExtensionSlaEventsClient
+from .utils import json_loads
+
+_NO_VERSION_HEADERS: Mapping[str, str] = MappingProxyType({})
+_RATE_LIMIT_FIELDS = ("limit", "remaining", "window_seconds", "reset_in")
 
 
 class RateLimitInfo(TypedDict):
@@ -32,6 +38,12 @@ class ExtensionEndpoints:
         self._client = client
         self.secrets = ExtensionSecretManager(client, extension_id)
         self._event_version = event_version
+        # Read-only so the mapping can be handed to every request without copying.
+        self._version_header_map: Mapping[str, str] = (
+            MappingProxyType({"X-Kiket-Event-Version": event_version})
+            if event_version
+            else _NO_VERSION_HEADERS
+        )
 
     async def log_event(self, message: str, **metadata: Any) -> None:
         payload: dict[str, Any] = {"message": message, "metadata": metadata}
@@ -72,16 +84,16 @@ class ExtensionEndpoints:
     async def rate_limit(self) -> RateLimitInfo:
         """Fetch the current extension-specific rate limit window."""
         response = await self._client.get("/api/v1/ext/rate_limit")
-        payload = response.json()
+        payload = json_loads(response.content)
         data = payload.get("rate_limit") or {}
-        return {
-            "limit": int(data.get("limit", 0) or 0),
-            "remaining": int(data.get("remaining", 0) or 0),
-            "window_seconds": int(data.get("window_seconds", 0) or 0),
-            "reset_in": int(data.get("reset_in", 0) or 0),
-        }
-
-    def _version_headers(self) -> dict[str, str]:
-        if not self._event_version:
-            return {}
-        return {"X-Kiket-Event-Version": self._event_version}
+        return cast(RateLimitInfo, {key: _as_int(data.get(key)) for key in _RATE_LIMIT_FIELDS})
+
+    def _version_headers(self) -> Mapping[str, str]:
+        return self._version_header_map
+
+
+def _as_int(value: Any) -> int:
+    # The API sends integers; only missing, null or stringified values need coercion.
+    if type(value) is int:
+        return value
+    return int(value or 0)
@@ -36,5 +36,9 @@ class ScopeError(KiketSDKError):
     ) -> None:
         self.required_scopes = required_scopes
         self.available_scopes = available_scopes
-        self.missing_scopes = [s for s in required_scopes if s not in available_scopes and "*" not in available_scopes]
+        available = set(available_scopes)
+        if "*" in available:
+            self.missing_scopes: list[str] = []
+        else:
+            self.missing_scopes = [s for s in required_scopes if s not in available]
         super().__init__(f"Insufficient scopes: missing {', '.join(self.missing_scopes)}")
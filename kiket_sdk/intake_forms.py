@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import builtins
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from datetime import datetime
 from typing import Any, TypedDict, cast
 from urllib.parse import quote
 
 from .client import KiketClient
+from .utils import json_loads
+
+_FORMS_PATH = "/api/v1/ext/intake_forms"
+_BOOL_STR = {True: "true", False: "false"}
+# Default cap on in-flight requests for the batch approve/reject helpers.
+DEFAULT_BATCH_CONCURRENCY = 8
 
 
 class IntakeFormField(TypedDict, total=False):
@@ -86,6 +95,8 @@ class IntakeFormsClient:
 
         self._client = client
         self._project_id = str(project_id)
+        self._project_params: Mapping[str, str] = {"project_id": self._project_id}
+        self._last_timestamp: tuple[datetime, str] | None = None
 
     async def list(
         self,
@@ -105,16 +116,16 @@ class IntakeFormsClient:
         Returns:
             Response with forms array
         """
-        params = self._base_params()
+        params: dict[str, str | int] = dict(self._base_params())
         if active is not None:
-            params["active"] = str(active).lower()
+            params["active"] = _BOOL_STR[active]
         if public_only is not None:
-            params["public"] = str(public_only).lower()
+            params["public"] = _BOOL_STR[public_only]
         if limit is not None:
-            params["limit"] = str(limit)
+            params["limit"] = limit
 
-        response = await self._client.get("/api/v1/ext/intake_forms", params=params)
-        return cast(IntakeFormListResponse, response.json())
+        response = await self._client.get(_FORMS_PATH, params=params)
+        return cast(IntakeFormListResponse, json_loads(response.content))
 
     async def get(self, form_key: str) -> IntakeForm:
         """
@@ -130,10 +141,10 @@ class IntakeFormsClient:
             raise ValueError("form_key is required")
 
         response = await self._client.get(
-            f"/api/v1/ext/intake_forms/{quote(str(form_key), safe='')}",
+            self._form_path(form_key),
             params=self._base_params(),
         )
-        return cast(IntakeForm, response.json())
+        return cast(IntakeForm, json_loads(response.content))
 
     def public_url(self, form: IntakeForm) -> str | None:
         """
@@ -172,19 +183,19 @@ class IntakeFormsClient:
         if not form_key:
             raise ValueError("form_key is required")
 
-        params = self._base_params()
+        params: dict[str, str | int] = dict(self._base_params())
         if status is not None:
             params["status"] = status
         if limit is not None:
-            params["limit"] = str(limit)
+            params["limit"] = limit
         if since is not None:
             params["since"] = self._format_timestamp(since)
 
         response = await self._client.get(
-            f"/api/v1/ext/intake_forms/{quote(str(form_key), safe='')}/submissions",
+            f"{self._form_path(form_key)}/submissions",
             params=params,
         )
-        return cast(IntakeSubmissionListResponse, response.json())
+        return cast(IntakeSubmissionListResponse, json_loads(response.content))
 
     async def get_submission(self, form_key: str, submission_id: str | int) -> IntakeSubmission:
         """
@@ -203,10 +214,10 @@ class IntakeFormsClient:
             raise ValueError("submission_id is required")
 
         response = await self._client.get(
-            f"/api/v1/ext/intake_forms/{quote(str(form_key), safe='')}/submissions/{submission_id}",
+            f"{self._form_path(form_key)}/submissions/{submission_id}",
             params=self._base_params(),
         )
-        return cast(IntakeSubmission, response.json())
+        return cast(IntakeSubmission, json_loads(response.content))
 
     async def create_submission(
         self,
@@ -240,10 +251,10 @@ class IntakeFormsClient:
             payload["metadata"] = metadata
 
         response = await self._client.post(
-            f"/api/v1/ext/intake_forms/{quote(str(form_key), safe='')}/submissions",
+            f"{self._form_path(form_key)}/submissions",
             json=payload,
         )
-        return cast(IntakeSubmission, response.json())
+        return cast(IntakeSubmission, json_loads(response.content))
 
     async def approve_submission(
         self,
@@ -273,10 +284,10 @@ class IntakeFormsClient:
             payload["notes"] = notes
 
         response = await self._client.post(
-            f"/api/v1/ext/intake_forms/{quote(str(form_key), safe='')}/submissions/{submission_id}/approve",
+            f"{self._form_path(form_key)}/submissions/{submission_id}/approve",
             json=payload,
         )
-        return cast(IntakeSubmission, response.json())
+        return cast(IntakeSubmission, json_loads(response.content))
 
     async def reject_submission(
         self,
@@ -306,10 +317,78 @@ class IntakeFormsClient:
             payload["notes"] = notes
 
         response = await self._client.post(
-            f"/api/v1/ext/intake_forms/{quote(str(form_key), safe='')}/submissions/{submission_id}/reject",
+            f"{self._form_path(form_key)}/submissions/{submission_id}/reject",
             json=payload,
         )
-        return cast(IntakeSubmission, response.json())
+        return cast(IntakeSubmission, json_loads(response.content))
+
+    async def approve_submissions(
+        self,
+        form_key: str,
+        submission_ids: Sequence[str | int],
+        *,
+        notes: str | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> builtins.list[IntakeSubmission | Exception]:
+        """
+        Approve several pending submissions concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once. A failure does not
+        stop the batch: every submission is attempted, and each failure is reported in
+        its submission's position so callers can tell exactly which ones failed.
+
+        Args:
+            form_key: The form key or ID
+            submission_ids: The submission IDs to approve
+            notes: Optional approval notes applied to every submission
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One entry per ID, in the order of ``submission_ids``: the updated submission,
+            or the exception raised while approving it
+        """
+        if not form_key:
+            raise ValueError("form_key is required")
+
+        return await _run_batch(
+            lambda submission_id: self.approve_submission(form_key, submission_id, notes=notes),
+            submission_ids,
+            max_concurrency,
+        )
+
+    async def reject_submissions(
+        self,
+        form_key: str,
+        submission_ids: Sequence[str | int],
+        *,
+        notes: str | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> builtins.list[IntakeSubmission | Exception]:
+        """
+        Reject several pending submissions concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once. A failure does not
+        stop the batch: every submission is attempted, and each failure is reported in
+        its submission's position so callers can tell exactly which ones failed.
+
+        Args:
+            form_key: The form key or ID
+            submission_ids: The submission IDs to reject
+            notes: Optional rejection notes applied to every submission
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One entry per ID, in the order of ``submission_ids``: the updated submission,
+            or the exception raised while rejecting it
+        """
+        if not form_key:
+            raise ValueError("form_key is required")
+
+        return await _run_batch(
+            lambda submission_id: self.reject_submission(form_key, submission_id, notes=notes),
+            submission_ids,
+            max_concurrency,
+        )
 
     async def stats(
         self,
@@ -330,21 +409,54 @@ class IntakeFormsClient:
         if not form_key:
             raise ValueError("form_key is required")
 
-        params = self._base_params()
+        params = dict(self._base_params())
         if period is not None:
             params["period"] = period
 
         response = await self._client.get(
-            f"/api/v1/ext/intake_forms/{quote(str(form_key), safe='')}/stats",
+            f"{self._form_path(form_key)}/stats",
             params=params,
         )
-        return cast(IntakeFormStats, response.json())
+        return cast(IntakeFormStats, json_loads(response.content))
+
+    def _form_path(self, form_key: str) -> str:
+        return f"{_FORMS_PATH}/{quote(str(form_key), safe='')}"
 
-    def _base_params(self) -> dict[str, str]:
-        return {"project_id": self._project_id}
+    def _base_params(self) -> Mapping[str, str]:
+        # Shared read-only template; callers that add filters copy it first.
+        return self._project_params
 
-    @staticmethod
-    def _format_timestamp(time: datetime | str) -> str:
+    def _format_timestamp(self, time: datetime | str) -> str:
+        if type(time) is str:
+            return time
         if isinstance(time, datetime):
-            return time.isoformat()
+            # Polling loops pass the same ``since`` object repeatedly. Datetimes are
+            # immutable and we hold a reference, so an identity check is safe.
+            last = self._last_timestamp
+            if last is not None and last[0] is time:
+                return last[1]
+            formatted = time.isoformat()
+            self._last_timestamp = (time, formatted)
+            return formatted
         return str(time)
+
+
+async def _run_batch(
+    action: Callable[[str | int], Awaitable[IntakeSubmission]],
+    submission_ids: Sequence[str | int],
+    max_concurrency: int,
+) -> list[IntakeSubmission | Exception]:
+    """Run ``action`` per ID with bounded concurrency, capturing failures per item."""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(submission_id: str | int) -> IntakeSubmission | Exception:
+        async with semaphore:
+            try:
+                return await action(submission_id)
+            except Exception as exc:
+                return exc
+
+    return list(await asyncio.gather(*(run(submission_id) for submission_id in submission_ids)))
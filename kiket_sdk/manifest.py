@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import cast
 
@@ -10,6 +11,11 @@ import yaml
 
 from .utils import environment_secret_name, resolve_env_reference
 
+try:  # pragma: no cover - depends on whether PyYAML was built against libyaml
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 DEFAULT_MANIFEST_FILENAMES = (
     "extension.yaml",
     "extension.yml",
@@ -24,58 +30,82 @@ class ManifestNotFoundError(FileNotFoundError):
 
 @dataclass(slots=True)
 class ExtensionManifest:
-    """Container for manifest metadata."""
+    """Container for manifest metadata.
+
+    Lookups into ``raw`` are resolved once in ``__post_init__``; ``env:`` references are
+    still resolved on every access so that environment changes are picked up.
+    """
 
     path: Path
     raw: dict
+    _extension_id: str | None = field(init=False, repr=False, compare=False)
+    _version: str | None = field(init=False, repr=False, compare=False)
+    _delivery_secret_ref: str | None = field(init=False, repr=False, compare=False)
+    _configuration_properties: dict[str, dict] = field(init=False, repr=False, compare=False)
+    _default_refs: tuple[tuple[str, object], ...] = field(init=False, repr=False, compare=False)
+    _secret_keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        raw = self.raw
+        extension = raw.get("extension")
+        if not isinstance(extension, dict):
+            extension = {}
+
+        self._extension_id = cast(str | None, raw.get("id") or extension.get("id"))
+        self._version = cast(str | None, raw.get("version") or extension.get("version"))
+
+        delivery = raw.get("delivery") or extension.get("delivery") or {}
+        if isinstance(delivery, str):
+            self._delivery_secret_ref = delivery
+        else:
+            callback = delivery.get("callback", {}) if isinstance(delivery, dict) else {}
+            self._delivery_secret_ref = callback.get("secret")
+
+        config = raw.get("configuration") or extension.get("configuration") or {}
+        properties = config.get("properties", {})
+        if not isinstance(properties, dict):
+            properties = {}
+        self._configuration_properties = properties
+
+        # Defaults and secret flags are collected in the same walk over the properties.
+        default_refs: list[tuple[str, object]] = []
+        secret_keys: list[str] = []
+        for key, meta in properties.items():
+            if not isinstance(meta, dict):
+                continue
+            if meta.get("secret"):
+                secret_keys.append(key)
+            default = meta.get("default")
+            if default is not None:
+                default_refs.append((key, default))
+        self._default_refs = tuple(default_refs)
+        self._secret_keys = tuple(secret_keys)
 
     @property
     def extension_id(self) -> str | None:
-        return cast(str | None, self.raw.get("id") or self.raw.get("extension", {}).get("id"))
+        return self._extension_id
 
     @property
     def version(self) -> str | None:
-        return cast(
-            str | None, self.raw.get("version") or self.raw.get("extension", {}).get("version")
-        )
+        return self._version
 
     @property
     def delivery_secret(self) -> str | None:
-        delivery = self.raw.get("delivery") or self.raw.get("extension", {}).get("delivery") or {}
-        if isinstance(delivery, str):
-            return resolve_env_reference(delivery)
-
-        callback = delivery.get("callback", {}) if isinstance(delivery, dict) else {}
-        secret = callback.get("secret")
-        return resolve_env_reference(secret)
+        return resolve_env_reference(self._delivery_secret_ref)
 
     def configuration_properties(self) -> dict[str, dict]:
-        config = (
-            self.raw.get("configuration")
-            or self.raw.get("extension", {}).get("configuration")
-            or {}
-        )
-        properties = config.get("properties", {})
-        if not isinstance(properties, dict):
-            return {}
-        return properties
+        return self._configuration_properties
 
     def settings_defaults(self) -> dict[str, object]:
         defaults: dict[str, object] = {}
-        for key, meta in self.configuration_properties().items():
-            if not isinstance(meta, dict):
-                continue
-            value = resolve_env_reference(meta.get("default"))
+        for key, default in self._default_refs:
+            value = resolve_env_reference(default)  # type: ignore[arg-type]
             if value is not None:
                 defaults[key] = value
         return defaults
 
     def secret_keys(self) -> tuple[str, ...]:
-        secrets = []
-        for key, meta in self.configuration_properties().items():
-            if isinstance(meta, dict) and meta.get("secret"):
-                secrets.append(key)
-        return tuple(secrets)
+        return self._secret_keys
 
 
 def load_manifest(path: str | None = None) -> ExtensionManifest | None:
@@ -101,8 +131,9 @@ def load_manifest(path: str | None = None) -> ExtensionManifest | None:
 
 
 def _load_yaml(path: Path) -> dict:
-    content = path.read_text(encoding="utf-8")
-    payload = yaml.safe_load(content)
+    # Hand raw bytes to the loader; it detects the encoding itself and the C
+    # loader skips the intermediate str decode.
+    payload = yaml.load(path.read_bytes(), Loader=_SafeLoader)
     if isinstance(payload, dict):
         return payload
     return {}
@@ -112,11 +143,20 @@ def apply_secret_env_overrides(
     settings: dict[str, object],
     secret_keys: tuple[str, ...],
 ) -> dict[str, object]:
-    """Overlay configuration settings with environment-provided secret values."""
+    """Overlay configuration settings with environment-provided secret values.
+
+    ``settings`` is returned as-is when no secret is set in the environment.
+    """
+    environ_get = os.environ.get
+    secret_name = environment_secret_name
+    overrides = [
+        (key, value)
+        for key in secret_keys
+        if (value := environ_get(secret_name(key))) is not None
+    ]
+    if not overrides:
+        return settings
+
     merged = dict(settings)
-    for key in secret_keys:
-        env_name = environment_secret_name(key)
-        env_value = resolve_env_reference(f"env:{env_name}")
-        if env_value is not None:
-            merged[key] = env_value
+    merged.update(overrides)
     return merged
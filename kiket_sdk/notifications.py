@@ -1,11 +1,12 @@
 """Notification types for extension development."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationRequest:
     """Standard notification request for extension delivery.
 
@@ -52,7 +53,7 @@ class NotificationRequest:
             raise ValueError(f"Invalid priority: {self.priority}")
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationResponse:
     """Standard notification response from extension.
 
@@ -72,24 +73,10 @@ class NotificationResponse:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert response to dictionary for JSON serialization."""
-        result: dict[str, Any] = {"success": self.success}
+        return _optional_fields({"success": self.success}, self, _NOTIFICATION_RESPONSE_FIELDS)
 
-        if self.message_id is not None:
-            result["message_id"] = self.message_id
 
-        if self.delivered_at is not None:
-            result["delivered_at"] = self.delivered_at.isoformat()
-
-        if self.error is not None:
-            result["error"] = self.error
-
-        if self.retry_after is not None:
-            result["retry_after"] = self.retry_after
-
-        return result
-
-
-@dataclass
+@dataclass(slots=True)
 class ChannelValidationRequest:
     """Request to validate a notification channel.
 
@@ -102,7 +89,7 @@ class ChannelValidationRequest:
     channel_type: str = "channel"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelValidationResponse:
     """Response from channel validation.
 
@@ -118,12 +105,28 @@ class ChannelValidationResponse:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert response to dictionary for JSON serialization."""
-        result: dict[str, Any] = {"valid": self.valid}
+        return _optional_fields({"valid": self.valid}, self, _CHANNEL_VALIDATION_RESPONSE_FIELDS)
+
+
+# (attribute, transform) pairs emitted by ``to_dict`` only when the attribute is not None.
+_FieldTable = tuple[tuple[str, Callable[[Any], Any] | None], ...]
+
+_NOTIFICATION_RESPONSE_FIELDS: _FieldTable = (
+    ("message_id", None),
+    ("delivered_at", datetime.isoformat),
+    ("error", None),
+    ("retry_after", None),
+)
 
-        if self.error is not None:
-            result["error"] = self.error
+_CHANNEL_VALIDATION_RESPONSE_FIELDS: _FieldTable = (
+    ("error", None),
+    ("metadata", None),
+)
 
-        if self.metadata is not None:
-            result["metadata"] = self.metadata
 
-        return result
+def _optional_fields(result: dict[str, Any], obj: object, fields: _FieldTable) -> dict[str, Any]:
+    for name, transform in fields:
+        value = getattr(obj, name)
+        if value is not None:
+            result[name] = transform(value) if transform else value
+    return result
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """Base response class for extension handlers."""
 
@@ -18,27 +18,26 @@ class Response:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        result = {"status": self.status, "metadata": self.metadata}
-        if self.message is not None:
-            result["message"] = self.message
-        return result
+        if self.message is None:
+            return {"status": self.status, "metadata": self.metadata}
+        return {"status": self.status, "message": self.message, "metadata": self.metadata}
 
 
-@dataclass
+@dataclass(slots=True)
 class AllowResponse(Response):
     """Success response that allows the operation to proceed."""
 
     status: str = "allow"
 
 
-@dataclass
+@dataclass(slots=True)
 class DenyResponse(Response):
     """Response that denies/rejects the operation."""
 
     status: str = "deny"
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingResponse(Response):
     """Response indicating async operation is pending."""
 
@@ -62,7 +61,8 @@ def allow(
         output_fields: Key-value pairs to display in configuration UI
 
     Returns:
-        Properly formatted response dict for Kiket
+        Properly formatted response dict for Kiket. When no ``output_fields`` are
+        given, ``data`` is used as the metadata dict as-is rather than copied.
 
     Example:
         >>> allow(
@@ -73,14 +73,14 @@ def allow(
         {'status': 'allow', 'message': 'Successfully configured',
          'metadata': {'route_id': 123, 'output_fields': {'inbound_email': 'abc@parse.example.com'}}}
     """
-    metadata = dict(data) if data else {}
     if output_fields:
-        metadata["output_fields"] = output_fields
+        metadata = {**data, "output_fields": output_fields} if data else {"output_fields": output_fields}
+    else:
+        metadata = data or {}
 
-    result: dict[str, Any] = {"status": "allow", "metadata": metadata}
-    if message is not None:
-        result["message"] = message
-    return result
+    if message is None:
+        return {"status": "allow", "metadata": metadata}
+    return {"status": "allow", "message": message, "metadata": metadata}
 
 
 def deny(message: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -1,8 +1,10 @@
 """Routing utilities for webhook handlers."""
 from __future__ import annotations
 
-from collections import defaultdict
+import inspect
+import sys
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
 
 Handler = Callable[..., Awaitable[object] | object]
 
@@ -37,19 +39,24 @@ def webhook(
 class HandlerMetadata:
     """Metadata for a registered handler."""
 
-    __slots__ = ("handler", "version", "required_scopes")
+    __slots__ = ("handler", "version", "required_scopes", "needs_context")
 
     def __init__(self, handler: Handler, version: str, required_scopes: list[str]) -> None:
         self.handler = handler
         self.version = version
         self.required_scopes = required_scopes
+        # Resolved once here so dispatch can skip building a context for payload-only handlers.
+        self.needs_context = _accepts_context(handler)
 
 
 class HandlerRegistry:
     """In-memory registry mapping event type to handler callables per version."""
 
     def __init__(self) -> None:
-        self._handlers: dict[str, dict[str, HandlerMetadata]] = defaultdict(dict)
+        # Keyed by (event, version) so a dispatch lookup is a single hash probe.
+        self._handlers: dict[tuple[str, str], HandlerMetadata] = {}
+        # Bumped on every registration so callers can cache views derived from the registry.
+        self.revision = 0
 
     def register(
         self,
@@ -59,37 +66,57 @@ class HandlerRegistry:
         version: str,
         required_scopes: list[str] | None = None,
     ) -> None:
-        validated = _coerce_version(version)
-        self._handlers[event][validated] = HandlerMetadata(
+        validated = sys.intern(_coerce_version(version))
+        self._handlers[(sys.intern(event), validated)] = HandlerMetadata(
             handler=handler,
             version=validated,
             required_scopes=required_scopes or [],
         )
+        self.revision += 1
 
     def get(self, event: str, version: str | None) -> HandlerMetadata | None:
         if version is None:
             return None
 
-        validated = _coerce_version(version)
-        event_handlers = self._handlers.get(event)
-        if not event_handlers:
-            return None
-
-        return event_handlers.get(validated)
+        return self._handlers.get((event, _coerce_version(version)))
 
     def all(self) -> dict[str, dict[str, HandlerMetadata]]:
-        return {event: handlers.copy() for event, handlers in self._handlers.items()}
+        grouped: dict[str, dict[str, HandlerMetadata]] = {}
+        for (event, version), metadata in self._handlers.items():
+            grouped.setdefault(event, {})[version] = metadata
+        return grouped
 
     def events(self) -> dict[str, dict[str, HandlerMetadata]]:
         """Return the registered handlers without exposing the internal dict."""
         return self.all()
 
     def event_names(self) -> list[str]:
-        return sorted(f"{event}@{version}" for event, versions in self._handlers.items() for version in versions.keys())
+        return sorted(f"{event}@{version}" for event, version in self._handlers)
 
 
+# Bounded: versions come from request headers/paths, but real traffic uses a handful.
+@lru_cache(maxsize=128)
 def _coerce_version(version: str) -> str:
     trimmed = version.strip()
     if not trimmed:
         raise ValueError("Event version cannot be blank.")
     return trimmed
+
+
+def _accepts_context(handler: Handler) -> bool:
+    """Return whether ``handler`` can be called as ``handler(payload, context)``."""
+    try:
+        parameters = inspect.signature(handler).parameters.values()
+    except (TypeError, ValueError):  # pragma: no cover - uninspectable callables
+        return True
+
+    positional = 0
+    for parameter in parameters:
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            return True
+        if parameter.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            positional += 1
+    return positional >= 2
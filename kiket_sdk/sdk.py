@@ -1,19 +1,23 @@
 """Core SDK class and FastAPI integration."""
 from __future__ import annotations
 
+import asyncio
 import inspect
+import logging
 import os
 import time
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Collection, Iterable, Mapping
 from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any
 
+import httpx
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 
-from .auth import AuthContext, build_auth_context, verify_runtime_token
-from .client import KiketClient
+from .auth import AuthContext, aclose_http_client, build_auth_context, verify_runtime_token
+from .client import DEFAULT_POOL_LIMITS, KiketClient
 from .config import ExtensionConfig
 from .endpoints import ExtensionEndpoints
 from .exceptions import AuthenticationError, KiketSDKError, ScopeError
@@ -21,11 +25,25 @@ from .manifest import apply_secret_env_overrides, load_manifest
 from .routing import HandlerRegistry
 from .secrets import ExtensionSecretManager
 from .telemetry import TelemetryRecord, TelemetryReporter
+from .utils import json_dumps, json_loads
 
-Handler = Callable[[Any, "HandlerContext"], Awaitable[Any] | Any]
+# Handlers take ``(payload, context)``, or just ``(payload)`` when they do not need a context.
+Handler = Callable[..., Awaitable[Any] | Any]
 ScopeChecker = Callable[..., None]
 SecretHelper = Callable[[str], str | None]
 
+# Dispatches reuse one pooled connection per API base URL. Payloads can name their own
+# base URL, so the number of pooled clients is capped; past that, requests fall back to
+# a per-dispatch client.
+_MAX_SHARED_HTTP_CLIENTS = 8
+
+logger = logging.getLogger(__name__)
+
+
+def _cookieless_jar() -> CookieJar:
+    """A cookie jar that never stores or sends cookies, for clients shared across tenants."""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=()))
+
 
 @dataclass(slots=True)
 class HandlerContext:
@@ -62,6 +80,8 @@ class KiketSDK:
         telemetry_enabled: bool = True,
         feedback_hook: Callable[[TelemetryRecord], Awaitable[None] | None] | None = None,
         telemetry_url: str | None = None,
+        telemetry_batch_size: int = 1,
+        telemetry_flush_interval_ms: int = 500,
     ) -> None:
         manifest = load_manifest(manifest_path)
         self.manifest = manifest
@@ -73,9 +93,8 @@ class KiketSDK:
         if manifest and auto_env_secrets:
             manifest_settings = apply_secret_env_overrides(manifest_settings, manifest.secret_keys())
 
-        merged_settings: dict[str, Any] = dict(manifest_settings)
-        if settings:
-            merged_settings.update(settings)
+        # Copy before merging: the manifest helpers may hand back a dict they still reference.
+        merged_settings = {**manifest_settings, **settings} if settings else manifest_settings
 
         resolved_extension_id = extension_id or (manifest.extension_id if manifest else None)
         resolved_extension_version = extension_version or (manifest.version if manifest else None)
@@ -96,7 +115,12 @@ class KiketSDK:
             feedback_hook=feedback_hook,
             extension_id=resolved_extension_id,
             extension_version=resolved_extension_version,
+            batch_size=telemetry_batch_size,
+            flush_interval_ms=telemetry_flush_interval_ms,
         )
+        self._http_clients: dict[str, httpx.AsyncClient] = {}
+        self._http_clients_loop: asyncio.AbstractEventLoop | None = None
+        self._health_cache: tuple[tuple[int, str | None, str | None], bytes] | None = None
         self.app = self._build_app()
 
     # ------------------------------------------------------------------
@@ -128,20 +152,37 @@ class KiketSDK:
     def load(self, module: Any) -> None:
         """Load all webhook handlers defined in a module."""
 
-        for attr in dir(module):
-            func = getattr(module, attr)
+        # vars() walks the namespace once in definition order, without dir()'s sort.
+        for attr, func in list(vars(module).items()):
+            if attr.startswith("__"):
+                continue
             event = getattr(func, "__kiket_event__", None)
             if event:
                 version = getattr(func, "__kiket_version__", None)
                 if version is None:
                     raise ValueError(f"Handler '{module.__name__}.{attr}' missing version metadata; use @sdk.webhook(..., version='...').")
-                self.registry.register(event, func, version=version)
+                self.registry.register(
+                    event,
+                    func,
+                    version=version,
+                    required_scopes=getattr(func, "__kiket_required_scopes__", None),
+                )
 
     # ------------------------------------------------------------------
     # Runtime API
     # ------------------------------------------------------------------
     def run(self, host: str = "127.0.0.1", port: int = 8000) -> None:  # pragma: no cover
-        uvicorn.run(self.app, host=host, port=port)
+        # "auto" selects uvloop/httptools when the ``fast`` extra is installed.
+        uvicorn.run(self.app, host=host, port=port, loop="auto", http="auto")
+
+    async def aclose(self) -> None:
+        """Flush background telemetry and close pooled HTTP connections held by the SDK."""
+        await self.telemetry.drain()
+        await self.telemetry.aclose()
+        clients, self._http_clients = self._http_clients, {}
+        for client in clients.values():
+            await client.aclose()
+        await aclose_http_client()
 
     def create_test_client(self):  # pragma: no cover - convenience wrapper
         from fastapi.testclient import TestClient
@@ -155,7 +196,13 @@ class KiketSDK:
         app = FastAPI(title="Kiket Extension")
 
         async def _dispatch(event: str, request: Request, path_version: str | None = None) -> Response:
-            payload = await request.json()
+            # The body bytes are decoded once here; nothing downstream re-reads request.json().
+            try:
+                payload = json_loads(await request.body())
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail="Invalid JSON payload") from exc
+            if not isinstance(payload, dict):
+                raise HTTPException(status_code=400, detail="Webhook payload must be a JSON object")
 
             # Resolve API base URL from payload or config
             api_base_url = payload.get("api", {}).get("base_url") or self.config.base_url
@@ -200,6 +247,11 @@ class KiketSDK:
                         },
                     )
 
+            if not metadata.needs_context:
+                # Payload-only handler: no API client, endpoints or context to build.
+                result = await self._invoke_with_telemetry(event, resolved_version, handler, payload, None)
+                return Response(json_dumps(result or {"ok": True}), media_type="application/json")
+
             # Extract payload secrets for quick access (bundled by SecretResolver)
             payload_secrets = payload.get("secrets") or {}
 
@@ -210,6 +262,7 @@ class KiketSDK:
                 base_url=api_base_url,
                 workspace_token=self.config.workspace_token,
                 runtime_token=auth_context.runtime_token,
+                http_client=await self._shared_http_client(api_base_url),
             ) as client:
                 endpoints = ExtensionEndpoints(
                     client,
@@ -219,7 +272,8 @@ class KiketSDK:
                 context = HandlerContext(
                     event=event,
                     event_version=resolved_version,
-                    headers=dict(request.headers),
+                    # Starlette's Headers is already an immutable, case-insensitive Mapping.
+                    headers=request.headers,
                     client=client,
                     endpoints=endpoints,
                     settings=self.config.settings.raw,
@@ -231,46 +285,31 @@ class KiketSDK:
                     auth=auth_context,
                     require_scopes=self._build_scope_checker(auth_context.scopes),
                 )
-                start_ns = time.perf_counter_ns()
-                try:
-                    result = await _invoke(handler, payload, context)
-                except Exception as exc:
-                    duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-                    await self.telemetry.record(
-                        event,
-                        resolved_version,
-                        "error",
-                        duration_ms,
-                        error_message=str(exc),
-                        error_class=exc.__class__.__name__,
-                    )
-                    raise
-                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-                await self.telemetry.record(
-                    event,
-                    resolved_version,
-                    "ok",
-                    duration_ms,
-                )
-            return JSONResponse(content=result or {"ok": True})
-
-        @app.post("/webhooks/{event}")
-        async def dispatch(event: str, request: Request) -> Response:
-            return await _dispatch(event, request)
-
-        @app.post("/v/{version}/webhooks/{event}")
-        async def dispatch_version(version: str, event: str, request: Request) -> Response:
-            return await _dispatch(event, request, path_version=version)
+                result = await self._invoke_with_telemetry(event, resolved_version, handler, payload, context)
+            return Response(json_dumps(result or {"ok": True}), media_type="application/json")
+
+        # Webhooks take the raw request, so they are mounted as plain Starlette routes: FastAPI's
+        # per-request dependency solving and OpenAPI registration would add nothing here.
+        async def dispatch(request: Request) -> Response:
+            return await _dispatch(request.path_params["event"], request)
+
+        async def dispatch_version(request: Request) -> Response:
+            params = request.path_params
+            return await _dispatch(params["event"], request, path_version=params["version"])
+
+        app.add_route("/webhooks/{event}", dispatch, methods=["POST"], include_in_schema=False)
+        app.add_route(
+            "/v/{version}/webhooks/{event}",
+            dispatch_version,
+            methods=["POST"],
+            include_in_schema=False,
+        )
 
         @app.get("/health")
         async def health() -> Response:
-            payload = {
-                "status": "ok",
-                "extension_id": self.config.extension_id,
-                "extension_version": self.config.extension_version,
-                "registered_events": self.registry.event_names(),
-            }
-            return JSONResponse(payload)
+            return Response(self._health_body(), media_type="application/json")
+
+        app.router.add_event_handler("shutdown", self.aclose)
 
         @app.exception_handler(KiketSDKError)
         async def sdk_error_handler(_: Request, exc: KiketSDKError) -> JSONResponse:
@@ -278,16 +317,101 @@ class KiketSDK:
 
         return app
 
-    def _check_scopes(self, required_scopes: list[str], available_scopes: list[str]) -> list[str]:
-        """Check if all required scopes are present. Returns missing scopes."""
-        if "*" in available_scopes:
+    def _health_body(self) -> bytes:
+        """Return the serialised /health payload, rebuilt only when its inputs change."""
+        key = (self.registry.revision, self.config.extension_id, self.config.extension_version)
+        cached = self._health_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        body = json_dumps({
+            "status": "ok",
+            "extension_id": self.config.extension_id,
+            "extension_version": self.config.extension_version,
+            "registered_events": self.registry.event_names(),
+        })
+        self._health_cache = (key, body)
+        return body
+
+    async def _invoke_with_telemetry(
+        self,
+        event: str,
+        version: str,
+        handler: Handler,
+        payload: Any,
+        context: HandlerContext | None,
+    ) -> Any:
+        clock = time.perf_counter_ns
+        record = self.telemetry.record_nowait
+        start_ns = clock()
+        try:
+            result = await _invoke(handler, payload, context)
+        except Exception as exc:
+            record(
+                event,
+                version,
+                "error",
+                (clock() - start_ns) / 1_000_000,
+                error_message=str(exc),
+                error_class=exc.__class__.__name__,
+            )
+            raise
+        record(event, version, "ok", (clock() - start_ns) / 1_000_000)
+        return result
+
+    async def _shared_http_client(self, base_url: str) -> httpx.AsyncClient | None:
+        """Return the pooled client for ``base_url`` on the running loop, if one can be kept.
+
+        Pooled clients serve every tenant and runtime token for a base URL, so they never
+        keep cookies: a ``Set-Cookie`` from one dispatch must not ride along on the next.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_clients_loop is not loop:
+            # Clients are bound to the loop they were first used on (e.g. TestClient
+            # starts a fresh loop per request), so close the old pool and start a new one.
+            stale, self._http_clients = self._http_clients, {}
+            self._http_clients_loop = loop
+            for key, stale_client in stale.items():
+                try:
+                    await stale_client.aclose()
+                except Exception as exc:  # pragma: no cover - the old loop may be gone
+                    logger.debug("Failed to close pooled client for %s: %s", key, exc)
+
+        key = base_url.rstrip("/")
+        client = self._http_clients.get(key)
+        if client is None or client.is_closed:
+            if client is None and len(self._http_clients) >= _MAX_SHARED_HTTP_CLIENTS:
+                return None
+            client = self._http_clients[key] = httpx.AsyncClient(
+                base_url=key,
+                timeout=15.0,
+                limits=DEFAULT_POOL_LIMITS,
+                cookies=_cookieless_jar(),
+            )
+        return client
+
+    def _check_scopes(
+        self, required_scopes: Iterable[str], available_scopes: Collection[str]
+    ) -> list[str]:
+        """Check if all required scopes are present. Returns missing scopes in required order."""
+        available = (
+            available_scopes
+            if isinstance(available_scopes, (set, frozenset))
+            else frozenset(available_scopes)
+        )
+        if "*" in available:
             return []
-        return [s for s in required_scopes if s not in available_scopes]
+        return [s for s in required_scopes if s not in available]
 
     def _build_scope_checker(self, available_scopes: list[str]) -> ScopeChecker:
         """Build a scope checker function for use in handler context."""
+        available: frozenset[str] | None = None
+
         def checker(*required_scopes: str) -> None:
-            missing = self._check_scopes(list(required_scopes), available_scopes)
+            nonlocal available
+            if available is None:
+                available = frozenset(available_scopes)
+            missing = self._check_scopes(required_scopes, available)
             if missing:
                 raise ScopeError(list(required_scopes), available_scopes)
         return checker
@@ -303,15 +427,24 @@ class KiketSDK:
             slack_token = context.secret('SLACK_BOT_TOKEN')
             # Returns payload["secrets"]["SLACK_BOT_TOKEN"] or os.getenv("SLACK_BOT_TOKEN")
         """
+        # ENV is read live on every lookup (os.environ is an in-process dict, not a libc call),
+        # so secrets rotated in the environment are picked up without a restart.
+        environ_get = os.environ.get
+        if not payload_secrets:
+            # Most payloads carry no secrets; the env lookup itself is the helper.
+            return environ_get
+
+        payload_get = payload_secrets.get
+
         def helper(key: str) -> str | None:
             # Payload secrets (per-org) take priority over ENV (extension defaults)
-            return payload_secrets.get(key) or os.getenv(key)
+            return payload_get(key) or environ_get(key)
         return helper
 
 
-async def _invoke(handler: Handler, payload: Any, context: HandlerContext) -> Any:
+async def _invoke(handler: Handler, payload: Any, context: HandlerContext | None) -> Any:
     try:
-        result = handler(payload, context)
+        result = handler(payload) if context is None else handler(payload, context)
         if inspect.isawaitable(result):
             return await result
         return result
@@ -19,9 +19,8 @@ def _parse_timestamp(value: str | None) -> datetime | None:
     if not value:
         return None
     try:
-        # Support both ISO8601 with timezone and UTC shorthand
-        sanitized = value.replace("Z", "+00:00")
-        return datetime.fromisoformat(sanitized)
+        # fromisoformat accepts both explicit offsets and the "Z" UTC shorthand on 3.11+.
+        return datetime.fromisoformat(value)
     except ValueError:
         return None
 
@@ -6,6 +6,7 @@ from collections.abc import Mapping
 from typing import Any, cast
 
 from .client import KiketClient
+from .utils import json_loads
 
 
 class ExtensionSlaEventsClient:
@@ -26,13 +27,13 @@ class ExtensionSlaEventsClient:
         limit: int | None = None,
     ) -> Mapping[str, Any]:
         """Return SLA events for the project."""
-        params: dict[str, str] = {"project_id": self._project_id}
+        params: dict[str, str | int] = {"project_id": self._project_id}
         if issue_id is not None:
-            params["issue_id"] = str(issue_id)
+            params["issue_id"] = issue_id
         if state is not None:
             params["state"] = state
         if limit is not None:
-            params["limit"] = str(limit)
+            params["limit"] = limit
 
         response = await self._client.get("/api/v1/ext/sla/events", params=params)
-        return cast(Mapping[str, Any], response.json())
+        return cast(Mapping[str, Any], json_loads(response.content))
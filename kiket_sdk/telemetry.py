@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import logging
 import os
 import time
@@ -12,11 +13,19 @@ from typing import Any
 
 import httpx
 
+from .utils import json_dumps
+
 logger = logging.getLogger("kiket_sdk.telemetry")
 
 
 FeedbackHook = Callable[["TelemetryRecord"], Awaitable[None] | None]
 
+# Upper bound on background telemetry deliveries in flight; further records are dropped.
+MAX_PENDING_RECORDS = 1000
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_JSON_HEADERS = {**_JSON_HEADERS, "Content-Encoding": "gzip"}
+
 
 def _is_truthy(value: str | None) -> bool:
     if value is None:
@@ -49,6 +58,9 @@ class TelemetryReporter:
         feedback_hook: FeedbackHook | None = None,
         extension_id: str | None,
         extension_version: str | None,
+        batch_size: int = 1,
+        flush_interval_ms: int = 500,
+        compress: bool = True,
     ) -> None:
         self.enabled = enabled and not _is_truthy(os.getenv("KIKET_SDK_TELEMETRY_OPTOUT"))
         resolved_url = telemetry_url or os.getenv("KIKET_SDK_TELEMETRY_URL")
@@ -59,6 +71,19 @@ class TelemetryReporter:
         self.feedback_hook = feedback_hook
         self.extension_id = extension_id
         self.extension_version = extension_version
+        self._pending: set[asyncio.Task[None]] = set()
+        # ``batch_size > 1`` buffers endpoint payloads and POSTs them as ``{"records": [...]}`` once
+        # the batch fills or ``flush_interval_ms`` elapses; the default keeps one POST per record.
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(flush_interval_ms, 0) / 1000
+        self.compress = compress
+        # Records are serialised as they arrive, so a pending batch holds bytes, not dicts.
+        self._batch: list[bytes] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # Created lazily on the loop that posts first, then reused so telemetry keeps its
+        # connections alive instead of opening a new one per record.
+        self._http: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
 
     async def record(self, event: str, version: str, status: str, duration_ms: float, **metadata: Any) -> None:
         if not self.enabled:
@@ -85,7 +110,7 @@ class TelemetryReporter:
                 logger.debug("Feedback hook failed: %s", exc)
 
         if self.telemetry_endpoint:
-            tasks.append(self._post(record))
+            tasks.append(self._post(record) if self.batch_size == 1 else self._enqueue(record))
 
         if tasks:
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -93,15 +118,102 @@ class TelemetryReporter:
                 if isinstance(result, Exception):
                     logger.debug("Telemetry dispatch failed: %s", result)
 
+    def record_nowait(
+        self, event: str, version: str, status: str, duration_ms: float, **metadata: Any
+    ) -> None:
+        """Schedule :meth:`record` in the background instead of awaiting hooks and the POST."""
+        if not self.enabled or not (self.feedback_hook or self.telemetry_endpoint):
+            return
+        if len(self._pending) >= MAX_PENDING_RECORDS:
+            logger.debug("Dropping telemetry for %s: %d records pending", event, len(self._pending))
+            return
+
+        task = asyncio.get_running_loop().create_task(
+            self.record(event, version, status, duration_ms, **metadata)
+        )
+        # The event loop only keeps weak references to tasks; hold them until done.
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait for background telemetry scheduled on the running loop to finish."""
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._pending if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self.flush()
+
+    async def aclose(self) -> None:
+        """Close the pooled telemetry HTTP client."""
+        client, self._http, self._http_loop = self._http, None, None
+        if client is not None:
+            await client.aclose()
+
+    async def flush(self) -> None:
+        """POST any buffered telemetry records immediately."""
+        if self._flush_task is not None and self._flush_task is not asyncio.current_task():
+            self._flush_task.cancel()
+        self._flush_task = None
+        if self._batch:
+            batch, self._batch = self._batch, []
+            await self._post_batch(batch)
+
+    async def _enqueue(self, record: TelemetryRecord) -> None:
+        self._batch.append(json_dumps(self._serialize(record)))
+        if len(self._batch) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def _post_batch(self, encoded: list[bytes]) -> None:
+        if not self.telemetry_endpoint:  # pragma: no cover
+            return
+
+        content = b"".join((b'{"records":[', b",".join(encoded), b"]}"))
+        headers = _JSON_HEADERS
+        if self.compress:
+            content = gzip.compress(content, compresslevel=1)
+            headers = _GZIP_JSON_HEADERS
+
+        try:
+            await self._client().post(self.telemetry_endpoint, content=content, headers=headers)
+        except Exception as exc:  # pragma: no cover - external network issues
+            logger.debug("Unable to POST telemetry batch: %s", exc)
+
     async def _post(self, record: TelemetryRecord) -> None:
         if not self.telemetry_endpoint:  # pragma: no cover
             return
 
+        try:
+            await self._client().post(
+                self.telemetry_endpoint,
+                content=json_dumps(self._serialize(record)),
+                headers=_JSON_HEADERS,
+            )
+        except Exception as exc:  # pragma: no cover - external network issues
+            logger.debug("Unable to POST telemetry: %s", exc)
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.is_closed or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(
+                timeout=2.0,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            )
+            self._http_loop = loop
+        return self._http
+
+    @staticmethod
+    def _serialize(record: TelemetryRecord) -> dict[str, Any]:
         metadata = dict(record.metadata or {})
         error_message = metadata.pop("error_message", None) or metadata.pop("message", None)
         error_class = metadata.pop("error_class", None)
 
-        payload = {
+        return {
             "event": record.event,
             "version": record.version,
             "status": record.status,
@@ -113,9 +225,3 @@ class TelemetryReporter:
             "error_class": error_class,
             "metadata": metadata,
         }
-
-        try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                await client.post(self.telemetry_endpoint, json=payload)
-        except Exception as exc:  # pragma: no cover - external network issues
-            logger.debug("Unable to POST telemetry: %s", exc)
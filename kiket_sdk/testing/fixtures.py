@@ -1,6 +1,8 @@
 """Pytest fixtures for extension testing."""
 from __future__ import annotations
 
+import hashlib
+import hmac
 from collections.abc import Callable
 from typing import Any
 
@@ -12,25 +14,27 @@ except ImportError:  # pragma: no cover - fixture module available only with pyt
 from fastapi.testclient import TestClient
 
 from kiket_sdk import KiketSDK
+from kiket_sdk.utils import json_dumps
 
 
 def webhook_payload_factory(secret: str | None = None) -> Callable[[dict[str, Any]], dict[str, Any]]:
     """Return a factory that produces signed webhook payloads."""
 
-    def factory(body: dict[str, Any]) -> dict[str, Any]:
-        import hashlib
-        import hmac
-        import json
+    # Key the HMAC once; each payload signs a copy instead of re-deriving the pads.
+    signer = hmac.new(secret.encode(), digestmod=hashlib.sha256) if secret else None
 
-        payload = json.dumps(body)
+    def factory(body: dict[str, Any]) -> dict[str, Any]:
+        # Sign the exact bytes that are sent; json_dumps uses orjson when it is installed.
+        raw = json_dumps(body)
         headers: dict[str, str] = {
             "Content-Type": "application/json",
             "X-Kiket-Timestamp": "1970-01-01T00:00:00Z",
         }
-        if secret:
-            signature = hmac.new(secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
-            headers["X-Kiket-Signature"] = signature
-        return {"body": payload, "headers": headers}
+        if signer is not None:
+            mac = signer.copy()
+            mac.update(raw)
+            headers["X-Kiket-Signature"] = mac.hexdigest()
+        return {"body": raw.decode(), "headers": headers}
 
     return factory
 
@@ -9,7 +9,13 @@ from fastapi.testclient import TestClient
 from kiket_sdk import KiketSDK
 
 
-def replay_payload(sdk: KiketSDK, event: str, payload_file: str | Path) -> Any:
+def replay_payload(
+    sdk: KiketSDK,
+    event: str,
+    payload_file: str | Path,
+    *,
+    client: TestClient | None = None,
+) -> Any:
     """Replay a recorded payload against the SDK handlers.
 
     Parameters
@@ -20,12 +26,13 @@ def replay_payload(sdk: KiketSDK, event: str, payload_file: str | Path) -> Any:
         Name of the webhook event to replay.
     payload_file:
         Path to the JSON payload captured from production logs.
+    client:
+        Optional test client for ``sdk.app`` to reuse across many replays instead of
+        building a new one per call.
     """
 
-    path = Path(payload_file)
-    body = path.read_text()
-    client = TestClient(sdk.app)
-    response = client.post(
+    body = Path(payload_file).read_bytes()
+    response = (client or TestClient(sdk.app)).post(
         f"/webhooks/{event}",
         content=body,
         headers={"Content-Type": "application/json"},
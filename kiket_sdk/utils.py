@@ -1,15 +1,26 @@
 """General utility helpers for the Kiket SDK."""
 from __future__ import annotations
 
+import json
 import os
 import re
+from functools import lru_cache
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback when the ``fast`` extra is absent
+    orjson = None  # type: ignore[assignment]
 
 ENV_SECRET_PREFIX = "KIKET_SECRET_"
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
 
 
+# Secret keys come from the manifest, so the set of distinct inputs is small and stable.
+@lru_cache(maxsize=256)
 def environment_secret_name(key: str) -> str:
     """Convert a manifest/config secret key into a canonical env var name."""
-    normalized = re.sub(r"[^A-Z0-9]+", "_", key.upper())
+    normalized = _NON_ALNUM.sub("_", key.upper())
     normalized = normalized.strip("_")
     return f"{ENV_SECRET_PREFIX}{normalized}"
 
@@ -24,3 +35,23 @@ def resolve_env_reference(value: str | None) -> str | None:
         var_name = value[len(prefix):].strip()
         return os.getenv(var_name) if var_name else None
     return value
+
+
+def json_loads(content: bytes | str) -> Any:
+    """Decode a JSON document, using ``orjson`` when the ``fast`` extra is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON, using ``orjson`` when the ``fast`` extra is installed."""
+    if orjson is not None:
+        try:
+            # OPT_NON_STR_KEYS stringifies int/float/bool keys the way the stdlib does.
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Anything orjson rejects (e.g. int subclasses, huge ints) gets the stdlib's answer.
+            pass
+    # Same rendering as Starlette's JSONResponse.
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,76 @@
+"""Shared fixtures for the SDK test suite."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from kiket_sdk.client import KiketClient
+
+try:  # pragma: no cover - optional dependency
+    import uvloop
+except ImportError:  # pragma: no cover - stdlib loop when uvloop is unavailable (e.g. Windows)
+    uvloop = None
+
+API_BASE_URL = "https://api.kiket.dev"
+
+MockHandler = Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]]
+
+
+def empty_list_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(status_code=200, json={"data": []})
+
+
+if uvloop is not None:  # pragma: no cover - depends on the optional uvloop install
+
+    # Not an optional hook: on a pytest-asyncio without it, collection fails loudly
+    # instead of silently falling back to the stdlib loop.
+    @pytest.hookimpl
+    def pytest_asyncio_loop_factories(config: pytest.Config, item: pytest.Item):
+        """Run the async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+class MockApi:
+    """Routes the shared client's requests to the handler installed by the current test."""
+
+    def __init__(self) -> None:
+        self.handler: MockHandler = empty_list_handler
+        self.requests: list[httpx.Request] = []
+
+    def reset(self) -> None:
+        self.handler = empty_list_handler
+        self.requests.clear()
+
+    @property
+    def last_request(self) -> httpx.Request:
+        return self.requests[-1]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response | Awaitable[httpx.Response]:
+        self.requests.append(request)
+        return self.handler(request)
+
+
+@pytest.fixture(scope="module")
+def shared_mock_api() -> MockApi:
+    return MockApi()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def kiket_client(shared_mock_api: MockApi) -> AsyncIterator[KiketClient]:
+    """A KiketClient entered once per module whose requests are served by ``mock_api``."""
+    client = KiketClient(API_BASE_URL, workspace_token="wk_test", runtime_token="rt_123")
+    client._client = httpx.AsyncClient(  # noqa: SLF001
+        transport=httpx.MockTransport(shared_mock_api), base_url=client.base_url
+    )
+    async with client:
+        yield client
+
+
+@pytest.fixture
+def mock_api(shared_mock_api: MockApi, kiket_client: KiketClient) -> MockApi:
+    """The shared client's handler, reset to an empty ``{"data": []}`` reply for each test."""
+    shared_mock_api.reset()
+    return shared_mock_api
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from kiket_sdk import audit
+from kiket_sdk.audit import AuditClient
+from kiket_sdk.client import KiketClient
+
+
+def _hash_pair(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(min(left, right) + max(left, right)).digest()
+
+
+def _build_tree(leaves: list[bytes]) -> list[list[bytes]]:
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append([_hash_pair(level[i], level[i + 1]) for i in range(0, len(level), 2)])
+    return levels
+
+
+def _proof_for(levels: list[list[bytes]], index: int) -> list[str]:
+    proof = []
+    for level in levels[:-1]:
+        proof.append("0x" + level[index ^ 1].hex())
+        index //= 2
+    return proof
+
+
+LEAVES = [hashlib.sha256(f"record-{i}".encode()).digest() for i in range(8)]
+TREE = _build_tree(LEAVES)
+ROOT = "0x" + TREE[-1][0].hex()
+
+
+def test_verify_proof_locally_accepts_valid_proofs():
+    for index, leaf in enumerate(LEAVES):
+        assert AuditClient.verify_proof_locally("0x" + leaf.hex(), _proof_for(TREE, index), index, ROOT)
+
+
+def test_verify_proof_locally_accepts_unprefixed_hashes():
+    proof = [sibling[2:] for sibling in _proof_for(TREE, 3)]
+    assert AuditClient.verify_proof_locally(LEAVES[3].hex(), proof, 3, ROOT[2:])
+
+
+def test_verify_proof_locally_rejects_tampered_leaf():
+    tampered = hashlib.sha256(b"tampered").hexdigest()
+    assert not AuditClient.verify_proof_locally(tampered, _proof_for(TREE, 0), 0, ROOT)
+
+
+def test_verify_proofs_batch_matches_single_verification():
+    indices = list(range(len(LEAVES)))
+    content_hashes = ["0x" + leaf.hex() for leaf in LEAVES]
+    proofs = [_proof_for(TREE, i) for i in indices]
+    content_hashes[5] = "0x" + hashlib.sha256(b"tampered").hexdigest()
+
+    results = AuditClient.verify_proofs_batch(content_hashes, proofs, [ROOT] * len(LEAVES))
+
+    assert results == [i != 5 for i in indices]
+
+
+def test_verify_proofs_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        AuditClient.verify_proofs_batch(["0x00"], [], [ROOT])
+
+
+def test_compute_content_hash_is_key_order_independent():
+    first = AuditClient.compute_content_hash({"b": 1, "a": {"y": 2, "x": 3}})
+    second = AuditClient.compute_content_hash({"a": {"x": 3, "y": 2}, "b": 1})
+
+    assert first == second
+    assert first == "0x" + hashlib.sha256(b'{"a":{"x":3,"y":2},"b":1}').hexdigest()
+
+
+def test_canonical_json_is_pinned():
+    # Content hashes must stay stable across SDK releases: compact separators,
+    # recursively sorted keys, and ASCII escaping of non-ASCII characters.
+    record = {"name": "Zoë", "id": 42, "tags": ["b", "a"], "meta": {"z": None, "a": 1.5}}
+
+    canonical = audit._canonicalize(record)  # noqa: SLF001
+
+    assert canonical == '{"id":42,"meta":{"a":1.5,"z":null},"name":"Zo\\u00eb","tags":["b","a"]}'
+    assert AuditClient.compute_content_hash(record) == "0x" + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def test_list_anchors_parses_response():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/audit/anchors"
+        assert request.url.params["status"] == "confirmed"
+        return httpx.Response(
+            200,
+            json={
+                "anchors": [
+                    {
+                        "id": 1,
+                        "merkle_root": ROOT,
+                        "leaf_count": 8,
+                        "network": "polygon_amoy",
+                        "status": "confirmed",
+                        "block_timestamp": "2025-01-02T03:04:05Z",
+                        "created_at": "2025-01-02T03:00:00+00:00",
+                    }
+                ],
+                "pagination": {"page": 1, "total": 1},
+            },
+        )
+
+    client = KiketClient("https://example.invalid", "wk_test")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+
+    async with client:
+        anchors, pagination = await AuditClient(client).list_anchors(status="confirmed")
+
+    assert pagination == {"page": 1, "total": 1}
+    assert anchors[0].merkle_root == ROOT
+    assert anchors[0].block_timestamp == datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+    assert anchors[0].first_record_at is None
+
+
+async def test_list_anchors_columns_returns_selected_fields():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "anchors": [
+                    {"id": 1, "merkle_root": "0xaa", "created_at": "2025-01-02T03:00:00Z"},
+                    {"id": 2, "merkle_root": "0xbb"},
+                ],
+                "pagination": {"page": 1},
+            },
+        )
+
+    client = KiketClient("https://example.invalid", "wk_test")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+
+    async with client:
+        audit_client = AuditClient(client)
+        columns, pagination = await audit_client.list_anchors_columns(
+            columns=["merkle_root", "created_at", "tx_hash"]
+        )
+        with pytest.raises(ValueError):
+            await audit_client.list_anchors_columns(columns=["nope"])
+
+    assert pagination == {"page": 1}
+    assert columns == {
+        "merkle_root": ["0xaa", "0xbb"],
+        "created_at": [datetime(2025, 1, 2, 3, tzinfo=UTC), None],
+        "tx_hash": [None, None],
+    }
+
+
+def test_batch_and_bytes_hashes_match_single_hash():
+    records = [{"id": i, "action": "update"} for i in range(3)]
+
+    hashes = AuditClient.compute_content_hashes(records)
+
+    assert hashes == [AuditClient.compute_content_hash(r) for r in records]
+    assert AuditClient.compute_content_hash_bytes(records[0]) == bytes.fromhex(hashes[0][2:])
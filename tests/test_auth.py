@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt.algorithms import ECAlgorithm
+
+from kiket_sdk import auth
+from kiket_sdk.exceptions import AuthenticationError
+
+BASE_URL = "https://kiket.invalid"
+PRIVATE_KEY = ec.generate_private_key(ec.SECP256R1())
+JWKS = {"keys": [{**json.loads(ECAlgorithm.to_jwk(PRIVATE_KEY.public_key())), "kid": "test-key", "alg": "ES256"}]}
+
+
+def issue_token(**claims) -> str:
+    now = int(time.time())
+    payload = {"sub": "ext", "iss": auth.ISSUER, "iat": now, "exp": now + 300, "scopes": ["issues.read"], **claims}
+    return jwt.encode(payload, PRIVATE_KEY, algorithm=auth.ALGORITHM, headers={"kid": "test-key"})
+
+
+@pytest.fixture
+def jwks_requests(monkeypatch):
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=JWKS)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(auth, "_get_http_client", lambda: client)
+    auth.clear_jwks_cache()
+    yield requests
+    auth.clear_jwks_cache()
+
+
+async def test_decode_jwt_uses_prefetched_jwks(jwks_requests):
+    decoded = await auth.decode_jwt(issue_token(org_id=7), BASE_URL)
+
+    assert decoded.org_id == 7
+    assert decoded.scopes == ["issues.read"]
+    assert [str(r.url) for r in jwks_requests] == [f"{BASE_URL}/.well-known/jwks.json"]
+
+
+async def test_jwks_client_is_cached_per_base_url(jwks_requests):
+    await auth.decode_jwt(issue_token(), BASE_URL)
+    await auth.decode_jwt(issue_token(), BASE_URL)
+
+    assert len(jwks_requests) == 1
+
+
+async def test_expired_token_is_rejected(jwks_requests):
+    token = issue_token(iat=int(time.time()) - 600, exp=int(time.time()) - 300)
+
+    with pytest.raises(AuthenticationError, match="expired"):
+        await auth.decode_jwt(token, BASE_URL)
+
+
+async def test_signature_is_verified_off_the_event_loop_thread(jwks_requests, monkeypatch):
+    verify = auth._verify_signature  # noqa: SLF001
+    threads = []
+
+    def recording_verify(token, jwks_client):
+        threads.append(threading.get_ident())
+        return verify(token, jwks_client)
+
+    monkeypatch.setattr(auth, "_verify_signature", recording_verify)
+
+    decoded = await auth.decode_jwt(issue_token(org_id=5), BASE_URL)
+
+    assert decoded.org_id == 5
+    assert threads and threads[0] != threading.get_ident()
+
+
+async def test_concurrent_cold_start_fetches_jwks_once(jwks_requests):
+    tokens = [issue_token() for _ in range(5)]
+
+    await asyncio.gather(*(auth.decode_jwt(token, BASE_URL) for token in tokens))
+
+    assert len(jwks_requests) == 1
+
+
+async def test_failed_jwks_fetch_is_not_cached(monkeypatch):
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503) if calls == 1 else httpx.Response(200, json=JWKS)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(auth, "_get_http_client", lambda: client)
+    auth.clear_jwks_cache()
+
+    with pytest.raises(AuthenticationError, match="Failed to fetch JWKS"):
+        await auth.decode_jwt(issue_token(), BASE_URL)
+
+    decoded = await auth.decode_jwt(issue_token(org_id=3), BASE_URL)
+    assert decoded.org_id == 3
+    auth.clear_jwks_cache()
+
+
+async def test_cancelled_jwks_fetch_is_not_cached(monkeypatch):
+    started = asyncio.Event()
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.Event().wait()  # hangs until cancelled
+        return httpx.Response(200, json=JWKS)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(auth, "_get_http_client", lambda: client)
+    auth.clear_jwks_cache()
+
+    waiter = asyncio.ensure_future(auth.decode_jwt(issue_token(), BASE_URL))
+    await started.wait()
+    # Simulate loop teardown cancelling the shared fetch task, not just the caller.
+    fetch_task = auth._jwks_cache[BASE_URL][0]  # noqa: SLF001
+    fetch_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert BASE_URL not in auth._jwks_cache  # noqa: SLF001
+    decoded = await auth.decode_jwt(issue_token(org_id=4), BASE_URL)
+    assert decoded.org_id == 4
+    auth.clear_jwks_cache()
+
+
+async def test_cancelled_caller_keeps_shared_jwks_fetch(jwks_requests):
+    waiter = asyncio.ensure_future(auth.decode_jwt(issue_token(), BASE_URL))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    await auth.decode_jwt(issue_token(), BASE_URL)
+    assert len(jwks_requests) == 1
+
+
+async def test_verified_runtime_tokens_are_cached(jwks_requests, monkeypatch):
+    calls: list[str] = []
+    decode_jwt = auth.decode_jwt
+
+    async def counting_decode(token: str, base_url: str) -> auth.JwtPayload:
+        calls.append(token)
+        return await decode_jwt(token, base_url)
+
+    monkeypatch.setattr(auth, "decode_jwt", counting_decode)
+    token = issue_token(org_id=5)
+    payload = {"authentication": {"runtime_token": token}}
+
+    first = await auth.verify_runtime_token(payload, BASE_URL)
+    second = await auth.verify_runtime_token(payload, BASE_URL)
+    await auth.verify_runtime_token(payload, "https://other.invalid")
+
+    assert first is second
+    assert second.org_id == 5
+    assert calls == [token, token]
+
+
+async def test_token_cache_can_be_disabled(jwks_requests, monkeypatch):
+    calls: list[str] = []
+    decode_jwt = auth.decode_jwt
+
+    async def counting_decode(token: str, base_url: str) -> auth.JwtPayload:
+        calls.append(token)
+        return await decode_jwt(token, base_url)
+
+    monkeypatch.setattr(auth, "decode_jwt", counting_decode)
+    monkeypatch.setattr(auth, "JWT_CACHE_TTL", 0)
+    payload = {"authentication": {"runtime_token": issue_token()}}
+
+    await auth.verify_runtime_token(payload, BASE_URL)
+    await auth.verify_runtime_token(payload, BASE_URL)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("token", ["not-a-jwt", "a.b", "a.b.c.d", 12345])
+async def test_malformed_tokens_are_rejected_before_jwks_fetch(jwks_requests, monkeypatch, token):
+    async def unexpected_decode(token: str, base_url: str) -> auth.JwtPayload:
+        raise AssertionError("decode_jwt should not be reached")
+
+    monkeypatch.setattr(auth, "decode_jwt", unexpected_decode)
+
+    with pytest.raises(AuthenticationError, match="not a compact JWT"):
+        await auth.verify_runtime_token({"authentication": {"runtime_token": token}}, BASE_URL)
+
+    assert jwks_requests == []
+
+
+def test_auth_context_scopes_are_copied():
+    jwt_payload = auth.JwtPayload(sub="ext", scopes=["issues.read"])
+
+    context = auth.build_auth_context(jwt_payload, {})
+    context.scopes.append("issues.write")
+
+    assert jwt_payload.scopes == ["issues.read"]
+
+
+async def test_jwks_is_refetched_when_ttl_disabled(jwks_requests, monkeypatch):
+    monkeypatch.setattr(auth, "JWKS_CACHE_TTL", 0)
+
+    await auth.decode_jwt(issue_token(), BASE_URL)
+    await auth.decode_jwt(issue_token(), BASE_URL)
+
+    assert len(jwks_requests) == 2
+
+
+@pytest.mark.parametrize("name", ["KIKET_JWT_CACHE_TTL", "KIKET_JWKS_TTL"])
+@pytest.mark.parametrize("raw", ["soon", "-5", "nan"])
+def test_invalid_ttl_env_values_fall_back_to_default(monkeypatch, caplog, name, raw):
+    monkeypatch.setenv(name, raw)
+
+    assert auth._env_seconds(name, 55.0) == 55.0
+    assert name in caplog.text
+
+
+def test_ttl_env_values_are_parsed_as_seconds(monkeypatch):
+    monkeypatch.setenv("KIKET_JWT_CACHE_TTL", "0")
+    assert auth._env_seconds("KIKET_JWT_CACHE_TTL", 55.0) == 0.0
+
+    monkeypatch.delenv("KIKET_JWT_CACHE_TTL")
+    assert auth._env_seconds("KIKET_JWT_CACHE_TTL", 55.0) == 55.0
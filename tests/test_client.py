@@ -1,76 +1,102 @@
 from __future__ import annotations
 
+import json
+
 import httpx
 import pytest
 
 from kiket_sdk.client import KiketClient
+from kiket_sdk.endpoints import ExtensionEndpoints
 from kiket_sdk.exceptions import OutboundRequestError, SecretStoreError
 
 
-class MockTransport(httpx.MockTransport):
-    pass
-
-
-@pytest.mark.asyncio
 async def test_client_request_success(monkeypatch):
     async def handler(request: httpx.Request):
         assert request.headers["Authorization"].startswith("Bearer ")
         return httpx.Response(200, json={"ok": True})
 
     client = KiketClient("https://example.invalid", "wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
     async with client as c:
         response = await c.get("/ping")
         assert response.json() == {"ok": True}
 
 
-@pytest.mark.asyncio
 async def test_client_request_error(monkeypatch):
     async def handler(request: httpx.Request):
         return httpx.Response(500)
 
     client = KiketClient("https://example.invalid", "wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
     async with client as c:
         with pytest.raises(OutboundRequestError):
             await c.get("/ping")
 
 
-@pytest.mark.asyncio
 async def test_secret_store_error(monkeypatch):
     async def handler(_: httpx.Request):
         return httpx.Response(500)
 
     client = KiketClient("https://example.invalid", "wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
     async with client as c:
         with pytest.raises(SecretStoreError):
             await c.store_secret("ext.test", "api_key", "value")
 
 
-@pytest.mark.asyncio
 async def test_store_secret_sends_payload(monkeypatch):
     async def handler(request: httpx.Request):
         assert request.method == "POST"
         assert request.url.path == "/api/v1/extensions/ext.test/secrets"
-        body = httpx.Response(200, content=request.content).json()
+        body = json.loads(request.content)
         assert body == {"secret": {"key": "api_key", "value": "value"}}
         return httpx.Response(201)
 
     client = KiketClient("https://example.invalid", "wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
     async with client as c:
         await c.store_secret("ext.test", "api_key", "value")
 
 
-@pytest.mark.asyncio
 async def test_runtime_token_header_is_sent():
     async def handler(request: httpx.Request):
         assert request.headers["X-Kiket-Runtime-Token"] == "rt_test"
         return httpx.Response(200, json={"ok": True})
 
     client = KiketClient("https://example.invalid", "wk_test", runtime_token="rt_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
     async with client as c:
         response = await c.get("/ping")
         assert response.json() == {"ok": True}
+
+
+def test_caller_headers_override_defaults():
+    client = KiketClient("https://example.invalid", "wk_test", runtime_token="rt_test")
+
+    headers = client._build_headers({"Authorization": "Bearer override", "X-Extra": "1"})  # noqa: SLF001
+
+    assert headers == {
+        "Accept": "application/json",
+        "Authorization": "Bearer override",
+        "X-Kiket-Runtime-Token": "rt_test",
+        "X-Extra": "1",
+    }
+    assert client._build_headers({}) == {  # noqa: SLF001
+        "Accept": "application/json",
+        "Authorization": "Bearer wk_test",
+        "X-Kiket-Runtime-Token": "rt_test",
+    }
+
+
+async def test_sub_clients_share_one_connection_pool():
+    client = KiketClient("https://example.invalid", "wk_test")
+    endpoints = ExtensionEndpoints(client, "com.example.ext")
+
+    custom_data = endpoints.custom_data(1)
+    intake_forms = endpoints.intake_forms(1)
+
+    assert custom_data._client is client  # noqa: SLF001
+    assert intake_forms._client is client  # noqa: SLF001
+
+    await client.aclose()
+    assert client._client.is_closed  # noqa: SLF001
@@ -5,31 +5,54 @@ import json
 import httpx
 import pytest
 
-from kiket_sdk.client import KiketClient
+from kiket_sdk import utils
 from kiket_sdk.custom_data import ExtensionCustomDataClient
 
 
-class MockTransport(httpx.MockTransport):
-    pass
+async def test_custom_data_client_includes_project_id_and_filters(kiket_client, mock_api):
+    custom_data = ExtensionCustomDataClient(kiket_client, project_id=7)
+    await custom_data.list("com.example.module", "records", filters={"status": "open"})
 
+    request = mock_api.last_request
+    assert request.url.path.endswith("/api/v1/ext/custom_data/com.example.module/records")
+    assert request.url.params["project_id"] == "7"
+    assert json.loads(request.url.params["filters"]) == {"status": "open"}
+    assert request.headers["X-Kiket-Runtime-Token"] == "rt_123"
 
-@pytest.mark.asyncio
-async def test_custom_data_client_includes_project_id_and_filters():
-    captured: dict[str, httpx.Request] = {}
 
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(status_code=200, json={"data": []})
+def test_path_encodes_segments_and_appends_record_id():
+    custom_data = ExtensionCustomDataClient(object(), project_id=7)  # type: ignore[arg-type]
 
-    client = KiketClient(base_url="https://api.kiket.dev", workspace_token=None, runtime_token="rt_123")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    assert custom_data._path("com.example/mod", "a b") == "/api/v1/ext/custom_data/com.example%2Fmod/a%20b"  # noqa: SLF001
+    assert custom_data._path("com.example/mod", "a b", 5) == "/api/v1/ext/custom_data/com.example%2Fmod/a%20b/5"  # noqa: SLF001
 
-    custom_data = ExtensionCustomDataClient(client, project_id=7)
-    async with client:  # reuse context manager for cleanup
-        await custom_data.list("com.example.module", "records", filters={"status": "open"})
 
-    request = captured["request"]
-    assert request.url.path.endswith("/api/v1/ext/custom_data/com.example.module/records")
-    assert request.url.params["project_id"] == "7"
-    assert json.loads(request.url.params["filters"]) == {"status": "open"}
-    assert request.headers["X-Kiket-Runtime-Token"] == "rt_123"
+def test_filter_encoding_keeps_value_types():
+    custom_data = ExtensionCustomDataClient(object(), project_id=7)  # type: ignore[arg-type]
+
+    first = custom_data._base_params(filters={"open": True})  # noqa: SLF001
+    second = custom_data._base_params(filters={"open": 1})  # noqa: SLF001
+    nested = custom_data._base_params(filters={"status": ["open", "closed"]})  # noqa: SLF001
+
+    assert first["filters"] == '{"open": true}'
+    assert second["filters"] == '{"open": 1}'
+    assert json.loads(nested["filters"]) == {"status": ["open", "closed"]}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_list_decodes_response_with_and_without_orjson(
+    kiket_client, mock_api, monkeypatch, use_orjson
+):
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson not installed")
+
+    mock_api.handler = lambda request: httpx.Response(
+        status_code=200, json={"data": [{"id": 1, "title": "Café"}]}
+    )
+
+    custom_data = ExtensionCustomDataClient(kiket_client, project_id=7)
+    result = await custom_data.list("com.example.module", "records")
+
+    assert result == {"data": [{"id": 1, "title": "Café"}]}
@@ -11,54 +11,28 @@ from kiket_sdk.endpoints import ExtensionEndpoints
 from kiket_sdk.sla import ExtensionSlaEventsClient
 
 
-class MockTransport(httpx.MockTransport):
-    pass
+async def test_log_event_invokes_api(kiket_client, mock_api):
+    mock_api.handler = lambda request: httpx.Response(status_code=204)
 
+    endpoints = ExtensionEndpoints(kiket_client)
+    await endpoints.log_event("issue.created", issue_id=1)
 
-@pytest.mark.asyncio
-async def test_log_event_invokes_api():
-    calls = {}
-
-    async def handler(request: httpx.Request) -> httpx.Response:
-        calls["method"] = request.method
-        calls["url"] = str(request.url)
-        calls["json"] = request.content.decode()
-        calls["headers"] = dict(request.headers)
-        return httpx.Response(status_code=204)
-
-    client = KiketClient(base_url="https://example.invalid", workspace_token="wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
-
-    async with client as http_client:
-        endpoints = ExtensionEndpoints(http_client)
-        await endpoints.log_event("issue.created", issue_id=1)
-
-    assert calls["method"] == "POST"
-    assert calls["url"].endswith("/api/v1/extensions/logs")
-    payload = json.loads(calls["json"])
+    request = mock_api.last_request
+    assert request.method == "POST"
+    assert str(request.url).endswith("/api/v1/extensions/logs")
+    payload = json.loads(request.content)
     assert payload["message"] == "issue.created"
     assert payload["metadata"]["issue_id"] == 1
-    assert "X-Kiket-Event-Version" not in calls["headers"]
+    assert "X-Kiket-Event-Version" not in request.headers
 
 
-@pytest.mark.asyncio
-async def test_version_header_added_when_event_version_present():
-    calls = {}
+async def test_version_header_added_when_event_version_present(kiket_client, mock_api):
+    mock_api.handler = lambda request: httpx.Response(status_code=204)
 
-    async def handler(request: httpx.Request) -> httpx.Response:
-        calls["headers"] = dict(request.headers)
-        return httpx.Response(status_code=204)
+    endpoints = ExtensionEndpoints(kiket_client, event_version="v2025")
+    await endpoints.notify("Ping", "Hello world")
 
-    client = KiketClient(base_url="https://example.invalid", workspace_token="wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
-
-    async with client as http_client:
-        endpoints = ExtensionEndpoints(http_client, event_version="v2025")
-        await endpoints.notify("Ping", "Hello world")
-
-    header_key = next((k for k in calls["headers"] if k.lower() == "x-kiket-event-version"), None)
-    assert header_key is not None
-    assert calls["headers"][header_key] == "v2025"
+    assert mock_api.last_request.headers["x-kiket-event-version"] == "v2025"
 
 
 def test_custom_data_helper_returns_client():
@@ -75,29 +49,46 @@ def test_sla_helper_returns_client():
     assert isinstance(helper, ExtensionSlaEventsClient)
 
 
-@pytest.mark.asyncio
-async def test_rate_limit_returns_payload():
-    async def handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(
-            status_code=200,
-            json={
-                "rate_limit": {
-                    "limit": 600,
-                    "remaining": 42,
-                    "window_seconds": 60,
-                    "reset_in": 12,
-                }
-            },
-        )
-
-    client = KiketClient(base_url="https://example.invalid", workspace_token="wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+async def test_rate_limit_returns_payload(kiket_client, mock_api):
+    mock_api.handler = lambda request: httpx.Response(
+        status_code=200,
+        json={
+            "rate_limit": {
+                "limit": 600,
+                "remaining": 42,
+                "window_seconds": 60,
+                "reset_in": 12,
+            }
+        },
+    )
 
-    async with client as http_client:
-        endpoints = ExtensionEndpoints(http_client)
-        info = await endpoints.rate_limit()
+    endpoints = ExtensionEndpoints(kiket_client)
+    info = await endpoints.rate_limit()
 
     assert info["limit"] == 600
     assert info["remaining"] == 42
     assert info["window_seconds"] == 60
     assert info["reset_in"] == 12
+
+
+def test_version_headers_are_shared_read_only_mappings():
+    client = KiketClient(base_url="https://example.invalid", workspace_token="wk_test")
+
+    unversioned = ExtensionEndpoints(client)
+    versioned = ExtensionEndpoints(client, event_version="v2025")
+
+    assert unversioned._version_headers() is ExtensionEndpoints(client)._version_headers()  # noqa: SLF001
+    assert dict(versioned._version_headers()) == {"X-Kiket-Event-Version": "v2025"}  # noqa: SLF001
+    with pytest.raises(TypeError):
+        versioned._version_headers()["X-Other"] = "1"  # type: ignore[index]  # noqa: SLF001
+
+
+async def test_rate_limit_coerces_missing_and_string_values(kiket_client, mock_api):
+    mock_api.handler = lambda request: httpx.Response(
+        status_code=200,
+        json={"rate_limit": {"limit": "600", "remaining": None, "reset_in": 12}},
+    )
+
+    info = await ExtensionEndpoints(kiket_client).rate_limit()
+
+    assert info == {"limit": 600, "remaining": 0, "window_seconds": 0, "reset_in": 12}
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+async def test_async_tests_run_on_uvloop_when_installed():
+    uvloop = pytest.importorskip("uvloop")
+
+    assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
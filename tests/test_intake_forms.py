@@ -1,354 +1,192 @@
 """Tests for the IntakeFormsClient."""
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from datetime import UTC, datetime
 
 import httpx
 import pytest
 
 from kiket_sdk.client import KiketClient
+from kiket_sdk.exceptions import OutboundRequestError
 from kiket_sdk.intake_forms import IntakeFormsClient
 
 
-class MockTransport(httpx.MockTransport):
-    pass
-
-
 @pytest.fixture
-def mock_client():
-    """Create a KiketClient with mock transport."""
-
-    async def default_handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(status_code=200, json={"data": []})
-
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(default_handler), base_url=client.base_url
-    )
-    return client
-
-
-@pytest.mark.asyncio
-async def test_list_intake_forms_includes_project_id():
-    """Test that list includes project_id in query params."""
-    captured: dict[str, httpx.Request] = {}
-
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(status_code=200, json={"data": []})
-
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
-
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    async with client:
-        await intake_forms.list()
-
-    request = captured["request"]
-    assert request.url.path.endswith("/api/v1/ext/intake_forms")
-    assert request.url.params["project_id"] == "42"
+def intake_forms(kiket_client: KiketClient) -> IntakeFormsClient:
+    return IntakeFormsClient(kiket_client, project_id=42)
+
+
+FORMS = "/api/v1/ext/intake_forms"
+
+# helper, args, kwargs, HTTP method, request path, expected query params, reply body
+CASES = [
+    ("list", (), {}, "GET", FORMS, {"project_id": "42"}, {"data": []}),
+    (
+        "list",
+        (),
+        {"active": True, "public_only": True, "limit": 10},
+        "GET",
+        FORMS,
+        {"active": "true", "public": "true", "limit": "10"},
+        {"data": []},
+    ),
+    ("get", ("feedback",), {}, "GET", f"{FORMS}/feedback", {}, {"id": 1, "key": "feedback"}),
+    (
+        "list_submissions",
+        ("feedback",),
+        {"status": "pending", "limit": 25},
+        "GET",
+        f"{FORMS}/feedback/submissions",
+        {"status": "pending", "limit": "25"},
+        {"data": []},
+    ),
+    (
+        "list_submissions",
+        ("feedback",),
+        {"since": datetime(2025, 1, 1, 12, 0, 0)},
+        "GET",
+        f"{FORMS}/feedback/submissions",
+        {"since": "2025-01-01T12:00:00"},
+        {"data": []},
+    ),
+    (
+        "create_submission",
+        ("feedback",),
+        {"data": {"email": "test@example.com", "message": "Hello"}, "metadata": {"source": "api"}},
+        "POST",
+        f"{FORMS}/feedback/submissions",
+        {},
+        {"id": 1, "status": "pending"},
+    ),
+    (
+        "approve_submission",
+        ("feedback", 1),
+        {"notes": "Looks good!"},
+        "POST",
+        f"{FORMS}/feedback/submissions/1/approve",
+        {},
+        {"id": 1, "status": "approved"},
+    ),
+    (
+        "reject_submission",
+        ("feedback", 1),
+        {"notes": "Invalid data"},
+        "POST",
+        f"{FORMS}/feedback/submissions/1/reject",
+        {},
+        {"id": 1, "status": "rejected"},
+    ),
+    (
+        "stats",
+        ("feedback",),
+        {"period": "month"},
+        "GET",
+        f"{FORMS}/feedback/stats",
+        {"period": "month"},
+        {"total_submissions": 100, "pending": 10},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("method", "args", "kwargs", "http_method", "path", "params", "reply"),
+    CASES,
+    ids=[case[0] for case in CASES],
+)
+async def test_intake_forms_requests(
+    intake_forms, mock_api, method, args, kwargs, http_method, path, params, reply
+):
+    """Each helper issues one request with the expected method, path and query params."""
+    mock_api.handler = lambda request: httpx.Response(status_code=200, json=reply)
+
+    result = await getattr(intake_forms, method)(*args, **kwargs)
+
+    request = mock_api.last_request
+    assert request.method == http_method
+    assert request.url.path == path
+    for key, value in params.items():
+        assert request.url.params[key] == value
     assert request.headers["X-Kiket-Runtime-Token"] == "rt_123"
+    assert result == reply
 
 
-@pytest.mark.asyncio
-async def test_list_intake_forms_with_filters():
-    """Test that list includes optional filters."""
-    captured: dict[str, httpx.Request] = {}
-
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(status_code=200, json={"data": []})
-
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
-
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    async with client:
-        await intake_forms.list(active=True, public_only=True, limit=10)
+async def test_approve_and_reject_submissions_in_batch(intake_forms, mock_api):
+    """Test batch approve/reject issue one request per submission and keep order."""
 
-    request = captured["request"]
-    assert request.url.params["active"] == "true"
-    assert request.url.params["public"] == "true"
-    assert request.url.params["limit"] == "10"
+    def handler(request: httpx.Request) -> httpx.Response:
+        submission_id = int(request.url.path.split("/")[-2])
+        status = "approved" if request.url.path.endswith("/approve") else "rejected"
+        return httpx.Response(status_code=200, json={"id": submission_id, "status": status})
 
+    mock_api.handler = handler
 
-@pytest.mark.asyncio
-async def test_get_intake_form():
-    """Test getting a specific intake form."""
-    captured: dict[str, httpx.Request] = {}
+    approved = await intake_forms.approve_submissions("feedback", [3, 1, 2], notes="ok")
+    rejected = await intake_forms.reject_submissions("feedback", [5])
 
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(
-            status_code=200,
-            json={
-                "id": 1,
-                "key": "feedback",
-                "name": "Feedback Form",
-                "active": True,
-                "public": True,
-            },
-        )
-
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
+    assert [item["id"] for item in approved] == [3, 1, 2]
+    assert all(item["status"] == "approved" for item in approved)
+    assert rejected == [{"id": 5, "status": "rejected"}]
+    assert sorted(request.url.path for request in mock_api.requests) == sorted(
+        [f"{FORMS}/feedback/submissions/{i}/approve" for i in (1, 2, 3)]
+        + [f"{FORMS}/feedback/submissions/5/reject"]
     )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
-
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    async with client:
-        result = await intake_forms.get("feedback")
 
-    request = captured["request"]
-    assert request.url.path.endswith("/api/v1/ext/intake_forms/feedback")
-    assert result["key"] == "feedback"
 
+async def test_batch_failures_are_reported_per_submission(intake_forms, mock_api):
+    """Test a failed submission does not hide which of the others were approved."""
 
-@pytest.mark.asyncio
-async def test_list_submissions():
-    """Test listing submissions for an intake form."""
-    captured: dict[str, httpx.Request] = {}
+    def handler(request: httpx.Request) -> httpx.Response:
+        submission_id = int(request.url.path.split("/")[-2])
+        if submission_id == 2:
+            return httpx.Response(status_code=422, json={"error": "not pending"})
+        return httpx.Response(status_code=200, json={"id": submission_id, "status": "approved"})
 
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(status_code=200, json={"data": []})
+    mock_api.handler = handler
 
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
+    results = await intake_forms.approve_submissions("feedback", [1, 2, 3])
 
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    async with client:
-        await intake_forms.list_submissions("feedback", status="pending", limit=25)
+    assert results[0] == {"id": 1, "status": "approved"}
+    assert isinstance(results[1], OutboundRequestError)
+    assert results[2] == {"id": 3, "status": "approved"}
 
-    request = captured["request"]
-    assert request.url.path.endswith("/api/v1/ext/intake_forms/feedback/submissions")
-    assert request.url.params["status"] == "pending"
-    assert request.url.params["limit"] == "25"
 
-
-@pytest.mark.asyncio
-async def test_list_submissions_with_since():
-    """Test listing submissions with since filter."""
-    captured: dict[str, httpx.Request] = {}
+async def test_batch_limits_requests_in_flight(intake_forms, mock_api):
+    """Test batch helpers never run more than max_concurrency requests at once."""
+    in_flight = peak = 0
 
     async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(status_code=200, json={"data": []})
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return httpx.Response(status_code=200, json={"status": "rejected"})
 
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
-
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    since_time = datetime(2025, 1, 1, 12, 0, 0)
-    async with client:
-        await intake_forms.list_submissions("feedback", since=since_time)
-
-    request = captured["request"]
-    assert "since" in request.url.params
-    assert request.url.params["since"] == "2025-01-01T12:00:00"
-
-
-@pytest.mark.asyncio
-async def test_create_submission():
-    """Test creating a submission."""
-    captured: dict[str, httpx.Request] = {}
-
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(
-            status_code=201,
-            json={"id": 1, "status": "pending", "data": {"email": "test@example.com"}},
-        )
-
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
+    mock_api.handler = handler
 
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    async with client:
-        result = await intake_forms.create_submission(
-            "feedback",
-            data={"email": "test@example.com", "message": "Hello"},
-            metadata={"source": "api"},
-        )
+    results = await intake_forms.reject_submissions("feedback", range(10), max_concurrency=3)
 
-    request = captured["request"]
-    assert request.method == "POST"
-    assert request.url.path.endswith("/api/v1/ext/intake_forms/feedback/submissions")
-    assert result["status"] == "pending"
+    assert len(results) == 10
+    assert peak == 3
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await intake_forms.reject_submissions("feedback", [1], max_concurrency=0)
 
 
-@pytest.mark.asyncio
-async def test_approve_submission():
-    """Test approving a submission."""
-    captured: dict[str, httpx.Request] = {}
-
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(
-            status_code=200,
-            json={"id": 1, "status": "approved"},
-        )
-
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
-
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    async with client:
-        result = await intake_forms.approve_submission("feedback", 1, notes="Looks good!")
-
-    request = captured["request"]
-    assert request.method == "POST"
-    assert request.url.path.endswith("/api/v1/ext/intake_forms/feedback/submissions/1/approve")
-    assert result["status"] == "approved"
-
-
-@pytest.mark.asyncio
-async def test_reject_submission():
-    """Test rejecting a submission."""
-    captured: dict[str, httpx.Request] = {}
-
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(
-            status_code=200,
-            json={"id": 1, "status": "rejected"},
-        )
-
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
-
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    async with client:
-        result = await intake_forms.reject_submission("feedback", 1, notes="Invalid data")
-
-    request = captured["request"]
-    assert request.method == "POST"
-    assert request.url.path.endswith("/api/v1/ext/intake_forms/feedback/submissions/1/reject")
-    assert result["status"] == "rejected"
-
-
-@pytest.mark.asyncio
-async def test_stats():
-    """Test getting submission statistics."""
-    captured: dict[str, httpx.Request] = {}
-
-    async def handler(request: httpx.Request) -> httpx.Response:
-        captured["request"] = request
-        return httpx.Response(
-            status_code=200,
-            json={
-                "total_submissions": 100,
-                "pending": 10,
-                "approved": 80,
-                "rejected": 5,
-                "converted": 5,
-            },
-        )
-
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    client._client = httpx.AsyncClient(
-        transport=MockTransport(handler), base_url=client.base_url
-    )
-
-    intake_forms = IntakeFormsClient(client, project_id=42)
-    async with client:
-        result = await intake_forms.stats("feedback", period="month")
-
-    request = captured["request"]
-    assert request.url.path.endswith("/api/v1/ext/intake_forms/feedback/stats")
-    assert request.url.params["period"] == "month"
-    assert result["total_submissions"] == 100
-
-
-def test_requires_project_id():
+def test_requires_project_id(kiket_client):
     """Test that project_id is required."""
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-
     with pytest.raises(ValueError, match="project_id is required"):
-        IntakeFormsClient(client, project_id=None)
+        IntakeFormsClient(kiket_client, project_id=None)
 
 
-@pytest.mark.asyncio
-async def test_get_requires_form_key():
+async def test_get_requires_form_key(intake_forms):
     """Test that form_key is required for get."""
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    intake_forms = IntakeFormsClient(client, project_id=42)
-
     with pytest.raises(ValueError, match="form_key is required"):
         await intake_forms.get("")
 
 
-def test_public_url_returns_url_for_public_form():
+def test_public_url_returns_url_for_public_form(intake_forms):
     """Test that public_url returns URL for public forms."""
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    intake_forms = IntakeFormsClient(client, project_id=42)
-
     form = {
         "id": 1,
         "key": "feedback",
@@ -358,15 +196,8 @@ def test_public_url_returns_url_for_public_form():
     assert intake_forms.public_url(form) == "https://app.kiket.dev/forms/feedback"
 
 
-def test_public_url_returns_none_for_private_form():
+def test_public_url_returns_none_for_private_form(intake_forms):
     """Test that public_url returns None for private forms."""
-    client = KiketClient(
-        base_url="https://api.kiket.dev",
-        workspace_token=None,
-        runtime_token="rt_123",
-    )
-    intake_forms = IntakeFormsClient(client, project_id=42)
-
     form = {
         "id": 1,
         "key": "internal",
@@ -374,3 +205,20 @@ def test_public_url_returns_none_for_private_form():
         "form_url": None,
     }
     assert intake_forms.public_url(form) is None
+
+
+def test_form_path_encodes_key(intake_forms):
+    """Test that form keys are percent-encoded into a single path segment."""
+    assert intake_forms._form_path("bug report/v2") == "/api/v1/ext/intake_forms/bug%20report%2Fv2"
+    assert intake_forms._form_path(7) == "/api/v1/ext/intake_forms/7"
+
+
+def test_format_timestamp_reuses_last_datetime_and_passes_strings_through(intake_forms):
+    """Test that timestamp formatting is cached per datetime object only."""
+    naive = datetime(2025, 1, 1, 12, 0, 0)
+    aware = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+    first = intake_forms._format_timestamp(naive)
+    assert intake_forms._format_timestamp(naive) is first
+    assert intake_forms._format_timestamp(aware) == "2025-01-01T12:00:00+00:00"
+    assert intake_forms._format_timestamp("2025-01-01") == "2025-01-01"
@@ -5,35 +5,41 @@ from textwrap import dedent
 import pytest
 
 from kiket_sdk import KiketSDK
+from kiket_sdk.manifest import ExtensionManifest, apply_secret_env_overrides, load_manifest
 from kiket_sdk.secrets import ExtensionSecretManager
+from kiket_sdk.utils import environment_secret_name
 
+MANIFEST_TEXT = dedent(
+    """
+    manifestVersion: "1.0"
+    id: com.example.sdk
+    version: "2.5.1"
+    delivery:
+      type: http
+      callback:
+        secret: env:TEST_WEBHOOK_SECRET
+    configuration:
+      properties:
+        example.apiUrl:
+          type: string
+          default: "https://api.example.com"
+        example.apiKey:
+          type: string
+          secret: true
+    """
+).strip()
 
-def write_manifest(tmp_path):
-    manifest_text = dedent(
-        """
-        manifestVersion: "1.0"
-        id: com.example.sdk
-        version: "2.5.1"
-        delivery:
-          type: http
-          callback:
-            secret: env:TEST_WEBHOOK_SECRET
-        configuration:
-          properties:
-            example.apiUrl:
-              type: string
-              default: "https://api.example.com"
-            example.apiKey:
-              type: string
-              secret: true
-        """
-    ).strip()
-    (tmp_path / "extension.yaml").write_text(manifest_text, encoding="utf-8")
-
-
-def test_sdk_auto_loads_manifest_and_env(tmp_path, monkeypatch):
-    write_manifest(tmp_path)
-    monkeypatch.chdir(tmp_path)
+
+@pytest.fixture(scope="module")
+def manifest_dir(tmp_path_factory):
+    """A directory holding the sample ``extension.yaml``; tests only read it."""
+    path = tmp_path_factory.mktemp("manifest")
+    (path / "extension.yaml").write_text(MANIFEST_TEXT, encoding="utf-8")
+    return path
+
+
+def test_sdk_auto_loads_manifest_and_env(manifest_dir, monkeypatch):
+    monkeypatch.chdir(manifest_dir)
     monkeypatch.setenv("TEST_WEBHOOK_SECRET", "whsec_123")
     monkeypatch.setenv("KIKET_SECRET_EXAMPLE_APIKEY", "env-secret-456")
     monkeypatch.setenv("KIKET_WORKSPACE_TOKEN", "wk_env_token")
@@ -49,7 +55,6 @@ def test_sdk_auto_loads_manifest_and_env(tmp_path, monkeypatch):
     assert sdk.manifest.path.name == "extension.yaml"
 
 
-@pytest.mark.asyncio
 async def test_secret_manager_prefers_environment(monkeypatch):
     monkeypatch.setenv("KIKET_SECRET_SAMPLE_TOKEN", "super-secret")
 
@@ -62,3 +67,70 @@ async def test_secret_manager_prefers_environment(monkeypatch):
 
     assert secret.value == "super-secret"
     assert secret.key == "sample.token"
+
+
+def test_load_manifest_reads_utf8_bytes(tmp_path):
+    path = tmp_path / "extension.yaml"
+    path.write_text('id: com.example.sdk\nname: "Café ✓"\n', encoding="utf-8")
+
+    manifest = load_manifest(str(path))
+
+    assert manifest is not None
+    assert manifest.raw == {"id": "com.example.sdk", "name": "Café ✓"}
+
+
+def test_load_manifest_ignores_non_mapping_documents(tmp_path):
+    path = tmp_path / "extension.yaml"
+    path.write_text("- just\n- a list\n", encoding="utf-8")
+
+    manifest = load_manifest(str(path))
+
+    assert manifest is not None
+    assert manifest.raw == {}
+
+
+def test_manifest_metadata_is_precomputed_but_env_refs_stay_live(manifest_dir, monkeypatch):
+    manifest = load_manifest(str(manifest_dir / "extension.yaml"))
+    assert manifest is not None
+
+    monkeypatch.setenv("TEST_WEBHOOK_SECRET", "first")
+    assert manifest.delivery_secret == "first"
+    monkeypatch.setenv("TEST_WEBHOOK_SECRET", "second")
+    assert manifest.delivery_secret == "second"
+
+    assert manifest.extension_id == "com.example.sdk"
+    assert manifest.version == "2.5.1"
+    assert manifest.configuration_properties() is manifest.configuration_properties()
+    assert manifest.secret_keys() == ("example.apiKey",)
+    assert manifest.settings_defaults() == {"example.apiUrl": "https://api.example.com"}
+
+
+def test_manifest_reads_nested_extension_block(tmp_path):
+    manifest = ExtensionManifest(
+        tmp_path / "extension.yaml",
+        {"extension": {"id": "com.example.nested", "version": "1.0.0", "delivery": "secret"}},
+    )
+
+    assert manifest.extension_id == "com.example.nested"
+    assert manifest.version == "1.0.0"
+    assert manifest.delivery_secret == "secret"
+    assert manifest.configuration_properties() == {}
+
+
+def test_apply_secret_env_overrides_only_copies_when_overriding(monkeypatch):
+    settings: dict[str, object] = {"example.apiKey": "default", "other": 1}
+    monkeypatch.delenv("KIKET_SECRET_EXAMPLE_APIKEY", raising=False)
+
+    assert apply_secret_env_overrides(settings, ("example.apiKey",)) is settings
+
+    monkeypatch.setenv("KIKET_SECRET_EXAMPLE_APIKEY", "from-env")
+    merged = apply_secret_env_overrides(settings, ("example.apiKey",))
+
+    assert merged == {"example.apiKey": "from-env", "other": 1}
+    assert settings["example.apiKey"] == "default"
+
+
+def test_environment_secret_name_normalises_keys():
+    assert environment_secret_name("example.apiKey") == "KIKET_SECRET_EXAMPLE_APIKEY"
+    assert environment_secret_name("--slack webhook/url--") == "KIKET_SECRET_SLACK_WEBHOOK_URL"
+    assert environment_secret_name("example.apiKey") is environment_secret_name("example.apiKey")
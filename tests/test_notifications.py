@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from kiket_sdk.notifications import (
+    ChannelValidationResponse,
+    NotificationRequest,
+    NotificationResponse,
+)
+
+
+def test_notification_response_to_dict_omits_unset_fields():
+    delivered_at = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+    assert NotificationResponse(success=False).to_dict() == {"success": False}
+    assert NotificationResponse(
+        success=True,
+        message_id="msg_1",
+        delivered_at=delivered_at,
+        error="rate limited",
+        retry_after=30,
+    ).to_dict() == {
+        "success": True,
+        "message_id": "msg_1",
+        "delivered_at": "2025-01-01T12:00:00+00:00",
+        "error": "rate limited",
+        "retry_after": 30,
+    }
+
+
+def test_channel_validation_response_to_dict_omits_unset_fields():
+    assert ChannelValidationResponse(valid=True).to_dict() == {"valid": True}
+    assert ChannelValidationResponse(valid=False, error="nope", metadata={"name": "ops"}).to_dict() == {
+        "valid": False,
+        "error": "nope",
+        "metadata": {"name": "ops"},
+    }
+
+
+def test_notification_request_validates_channel():
+    with pytest.raises(ValueError, match="channel_id is required"):
+        NotificationRequest(message="hi", channel_type="channel")
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+import kiket_sdk
+
+
+def test_all_matches_lazy_import_table():
+    assert sorted(kiket_sdk.__all__) == sorted(kiket_sdk._LAZY_IMPORTS)  # noqa: SLF001
+    assert len(set(kiket_sdk.__all__)) == len(kiket_sdk.__all__)
+
+
+@pytest.mark.parametrize("name", kiket_sdk.__all__)
+def test_public_names_resolve(name: str):
+    module_name, attr = kiket_sdk._LAZY_IMPORTS[name]  # noqa: SLF001
+    module = importlib.import_module(f"kiket_sdk.{module_name}")
+
+    expected = getattr(module, attr) if attr else module
+
+    assert getattr(kiket_sdk, name) is expected
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        kiket_sdk.DoesNotExist  # noqa: B018
@@ -1,6 +1,6 @@
 """Tests for response helpers."""
 
-from kiket_sdk.responses import allow, deny, pending
+from kiket_sdk.responses import AllowResponse, DenyResponse, allow, deny, pending
 
 
 class TestAllow:
@@ -76,3 +76,27 @@ class TestPending:
         """Should include data in metadata."""
         response = pending(message="Processing", data={"job_id": "abc123"})
         assert response["metadata"] == {"job_id": "abc123"}
+
+
+class TestResponseDataclasses:
+    """Tests for the response dataclasses."""
+
+    def test_to_dict_omits_missing_message(self):
+        """Should only include message when set."""
+        assert AllowResponse().to_dict() == {"status": "allow", "metadata": {}}
+        assert DenyResponse(message="nope").to_dict() == {
+            "status": "deny",
+            "message": "nope",
+            "metadata": {},
+        }
+
+    def test_instances_use_slots(self):
+        """Should not allocate a per-instance __dict__."""
+        assert not hasattr(AllowResponse(), "__dict__")
+
+    def test_allow_does_not_mutate_caller_data_with_output_fields(self):
+        """Should copy data before adding output_fields."""
+        data = {"route_id": 1}
+        response = allow(data=data, output_fields={"url": "https://example.com"})
+        assert data == {"route_id": 1}
+        assert response["metadata"] == {"route_id": 1, "output_fields": {"url": "https://example.com"}}
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from kiket_sdk.routing import HandlerRegistry
+
+
+def handler(payload, context):
+    return None
+
+
+def test_registry_looks_up_by_event_and_trimmed_version():
+    registry = HandlerRegistry()
+    registry.register("issue.created", handler, version=" v1 ", required_scopes=["issues.read"])
+    registry.register("issue.created", handler, version="v2")
+    registry.register("issue.closed", handler, version="v1")
+
+    metadata = registry.get("issue.created", "v1 ")
+
+    assert metadata is not None
+    assert metadata.version == "v1"
+    assert metadata.required_scopes == ["issues.read"]
+    assert registry.get("issue.created", "v3") is None
+    assert registry.get("issue.unknown", "v1") is None
+    assert registry.get("issue.created", None) is None
+    assert registry.event_names() == ["issue.closed@v1", "issue.created@v1", "issue.created@v2"]
+    assert set(registry.all()["issue.created"]) == {"v1", "v2"}
+
+
+def test_registry_rejects_blank_versions():
+    with pytest.raises(ValueError):
+        HandlerRegistry().register("issue.created", handler, version="  ")
+
+
+@pytest.mark.parametrize(
+    ("func", "expected"),
+    [
+        (lambda payload: None, False),
+        (lambda payload, context: None, True),
+        (lambda *args: None, True),
+        (lambda payload, *, context=None: None, False),
+    ],
+)
+def test_handler_metadata_detects_context_parameter(func, expected):
+    registry = HandlerRegistry()
+    registry.register("issue.created", func, version="v1")
+
+    assert registry.get("issue.created", "v1").needs_context is expected
+
+
+def test_revision_increments_on_register():
+    registry = HandlerRegistry()
+    assert registry.revision == 0
+
+    registry.register("issue.created", handler, version="v1")
+    registry.register("issue.created", handler, version="v1")
+
+    assert registry.revision == 2
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import types
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from kiket_sdk import KiketSDK, utils, webhook
+from kiket_sdk import sdk as sdk_module
+from kiket_sdk.auth import JwtPayload
+from kiket_sdk.exceptions import ScopeError
+from kiket_sdk.manifest import ExtensionManifest
+
+
+@pytest.fixture
+def sdk(monkeypatch) -> KiketSDK:
+    async def fake_verify(payload, base_url):
+        return JwtPayload(sub="ext", scopes=["issues.read"])
+
+    monkeypatch.setattr(sdk_module, "verify_runtime_token", fake_verify)
+    return KiketSDK(
+        workspace_token="wk_test",
+        base_url="https://kiket.invalid",
+        extension_id="ext.test",
+        extension_version="1.0.0",
+        telemetry_enabled=False,
+    )
+
+
+def webhook_payload(**extra):
+    return {"authentication": {"runtime_token": "rt_test"}, **extra}
+
+
+def test_dispatch_reuses_pooled_http_client(sdk: KiketSDK):
+    seen = []
+
+    @sdk.webhook("issue.created", version="v1")
+    async def handle(payload, context):
+        seen.append(context.client._client)  # noqa: SLF001
+        return {"ok": True}
+
+    with TestClient(sdk.app) as client:
+        for _ in range(2):
+            response = client.post("/webhooks/issue.created?version=v1", json=webhook_payload())
+            assert response.status_code == 200
+            assert response.json() == {"ok": True}
+
+        assert seen[0] is seen[1]
+        assert not seen[0].is_closed
+
+    assert seen[0].is_closed
+
+
+def test_pooled_clients_are_closed_when_the_event_loop_changes(sdk: KiketSDK):
+    seen = []
+
+    @sdk.webhook("issue.created", version="v1")
+    async def handle(payload, context):
+        seen.append(context.client._client)  # noqa: SLF001
+        return {"ok": True}
+
+    # Outside ``with``, TestClient runs every request on a fresh event loop.
+    client = TestClient(sdk.app)
+    for _ in range(2):
+        assert client.post("/webhooks/issue.created?version=v1", json=webhook_payload()).status_code == 200
+
+    assert seen[0] is not seen[1]
+    assert seen[0].is_closed
+
+
+async def test_pooled_clients_never_keep_cookies(sdk: KiketSDK):
+    client = await sdk._shared_http_client("https://kiket.invalid")  # noqa: SLF001
+    assert client is not None
+    request = httpx.Request("GET", "https://kiket.invalid/api/v1/me")
+    response = httpx.Response(200, headers={"Set-Cookie": "session=tenant-a; Path=/"}, request=request)
+
+    client.cookies.extract_cookies(response)
+
+    assert len(client.cookies.jar) == 0
+    await sdk.aclose()
+
+
+def test_telemetry_is_recorded_in_background_and_drained_on_shutdown(monkeypatch):
+    async def fake_verify(payload, base_url):
+        return JwtPayload(sub="ext", scopes=[])
+
+    monkeypatch.setattr(sdk_module, "verify_runtime_token", fake_verify)
+    records = []
+
+    async def feedback(record):
+        records.append(record)
+
+    sdk = KiketSDK(
+        workspace_token="wk_test",
+        base_url="https://kiket.invalid",
+        extension_id="ext.test",
+        extension_version="1.0.0",
+        feedback_hook=feedback,
+    )
+    sdk.webhook("issue.created", version="v1")(lambda payload, context: {"ok": True})
+
+    with TestClient(sdk.app) as client:
+        response = client.post("/webhooks/issue.created?version=v1", json=webhook_payload())
+        assert response.status_code == 200
+
+    assert [(r.event, r.status) for r in records] == [("issue.created", "ok")]
+
+
+def test_missing_scopes_are_rejected_in_declared_order(sdk: KiketSDK):
+    sdk.register(
+        "issue.deleted",
+        lambda payload, context: {"ok": True},
+        version="v1",
+        required_scopes=["issues.write", "issues.read", "issues.delete"],
+    )
+
+    with TestClient(sdk.app) as client:
+        response = client.post("/webhooks/issue.deleted?version=v1", json=webhook_payload())
+
+    assert response.status_code == 403
+    assert response.json()["detail"]["missing_scopes"] == ["issues.write", "issues.delete"]
+
+
+def test_scope_checker_honours_wildcard(sdk: KiketSDK):
+    assert sdk._check_scopes(["a", "b"], ["*"]) == []  # noqa: SLF001
+    checker = sdk._build_scope_checker(["issues.read"])  # noqa: SLF001
+
+    checker("issues.read")
+    with pytest.raises(ScopeError) as excinfo:
+        checker("issues.read", "issues.write")
+    assert excinfo.value.missing_scopes == ["issues.write"]
+
+
+def test_load_registers_decorated_handlers_with_scopes(sdk: KiketSDK):
+    module = types.ModuleType("handlers")
+
+    @webhook("issue.created", version="v1", required_scopes=["issues.read"])
+    def _private_handler(payload, context):
+        return None
+
+    module._private_handler = _private_handler  # type: ignore[attr-defined]
+    module.not_a_handler = object()  # type: ignore[attr-defined]
+
+    sdk.load(module)
+
+    metadata = sdk.registry.get("issue.created", "v1")
+    assert metadata is not None
+    assert metadata.handler is _private_handler
+    assert metadata.required_scopes == ["issues.read"]
+
+
+def test_handler_headers_are_case_insensitive_and_read_only(sdk: KiketSDK):
+    seen = {}
+
+    @sdk.webhook("issue.created", version="v1")
+    def handle(payload, context):
+        seen["value"] = context.headers["x-custom-header"]
+        seen["mapping"] = context.headers
+        return None
+
+    with TestClient(sdk.app) as client:
+        client.post(
+            "/webhooks/issue.created?version=v1",
+            json=webhook_payload(),
+            headers={"X-Custom-Header": "yes"},
+        )
+
+    assert seen["value"] == "yes"
+    assert seen["mapping"]["X-CUSTOM-HEADER"] == "yes"
+    with pytest.raises(TypeError):
+        seen["mapping"]["x-custom-header"] = "no"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dispatch_round_trips_json_with_and_without_orjson(monkeypatch, sdk: KiketSDK, use_orjson):
+    if use_orjson and utils.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    @sdk.webhook("issue.created", version="v1")
+    def handle(payload, context):
+        return {"echo": payload["issue"]}
+
+    with TestClient(sdk.app) as client:
+        response = client.post(
+            "/webhooks/issue.created?version=v1",
+            json=webhook_payload(issue={"title": "Café", "id": 7}),
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"echo": {"title": "Café", "id": 7}}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dispatch_renders_non_str_keys_like_the_stdlib(monkeypatch, sdk: KiketSDK, use_orjson):
+    if use_orjson and utils.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    @sdk.webhook("issue.created", version="v1")
+    def handle(payload):
+        return {1: "a", "nested": {2.5: True, False: None}, "big": 2**70}
+
+    with TestClient(sdk.app) as client:
+        response = client.post("/webhooks/issue.created?version=v1", json=webhook_payload())
+
+    assert response.status_code == 200
+    assert response.content == b'{"1":"a","nested":{"2.5":true,"false":null},"big":1180591620717411303424}'
+
+
+def test_payload_only_handlers_skip_context_construction(sdk: KiketSDK, monkeypatch):
+    def fail_shared_client(base_url):
+        raise AssertionError("payload-only handlers should not need an API client")
+
+    monkeypatch.setattr(sdk, "_shared_http_client", fail_shared_client)
+
+    @sdk.webhook("issue.created", version="v1")
+    async def handle(payload):
+        return {"id": payload["id"]}
+
+    with TestClient(sdk.app) as client:
+        response = client.post("/webhooks/issue.created?version=v1", json=webhook_payload(id=3))
+
+    assert response.status_code == 200
+    assert response.json() == {"id": 3}
+    assert sdk.registry.get("issue.created", "v1").needs_context is False
+
+
+def test_webhook_routes_resolve_path_params_outside_openapi(sdk: KiketSDK):
+    sdk.webhook("issue.created", version="v2")(lambda payload, context: {"version": "v2"})
+
+    with TestClient(sdk.app) as client:
+        response = client.post("/v/v2/webhooks/issue.created", json=webhook_payload())
+        assert response.status_code == 200
+        assert response.json() == {"version": "v2"}
+
+        missing = client.post("/webhooks/issue.created?version=v9", json=webhook_payload())
+        assert missing.status_code == 404
+        assert "v9" in missing.json()["detail"]
+
+        paths = client.get("/openapi.json").json()["paths"]
+
+    assert "/health" in paths
+    assert not any("webhooks" in path for path in paths)
+
+
+def test_settings_override_is_merged_without_mutating_caller_dict(tmp_path, monkeypatch):
+    manifest = tmp_path / "extension.yaml"
+    manifest.write_text(
+        "extension:\n"
+        "  id: ext.test\n"
+        "  version: 1.0.0\n"
+        "  configuration:\n"
+        "    properties:\n"
+        "      region:\n"
+        "        default: eu\n"
+        "      mode:\n"
+        "        default: sync\n"
+    )
+    overrides = {"mode": "async"}
+
+    sdk = KiketSDK(manifest_path=str(manifest), settings=overrides, telemetry_enabled=False)
+
+    assert sdk.config.settings.raw == {"region": "eu", "mode": "async"}
+    assert overrides == {"mode": "async"}
+    assert KiketSDK(manifest_path=str(manifest), telemetry_enabled=False).config.settings.raw == {
+        "region": "eu",
+        "mode": "sync",
+    }
+
+
+def test_settings_override_does_not_mutate_manifest_defaults(tmp_path, monkeypatch):
+    manifest = tmp_path / "extension.yaml"
+    manifest.write_text("extension:\n  id: ext.test\n  version: 1.0.0\n")
+    defaults = {"region": "eu"}
+    monkeypatch.setattr(ExtensionManifest, "settings_defaults", lambda self: defaults)
+
+    sdk = KiketSDK(manifest_path=str(manifest), settings={"region": "us"}, telemetry_enabled=False)
+
+    assert sdk.config.settings.raw == {"region": "us"}
+    assert defaults == {"region": "eu"}
+
+
+def test_telemetry_batching_options_are_passed_to_reporter():
+    sdk = KiketSDK(
+        base_url="https://kiket.invalid",
+        telemetry_batch_size=25,
+        telemetry_flush_interval_ms=1000,
+    )
+
+    assert sdk.telemetry.batch_size == 25
+    assert sdk.telemetry.flush_interval == 1.0
+
+
+def test_malformed_webhook_body_is_rejected_with_400(sdk: KiketSDK):
+    sdk.webhook("issue.created", version="v1")(lambda payload, context: {"ok": True})
+
+    with TestClient(sdk.app) as client:
+        invalid = client.post(
+            "/webhooks/issue.created?version=v1",
+            content=b"{not json",
+            headers={"Content-Type": "application/json"},
+        )
+        not_object = client.post("/webhooks/issue.created?version=v1", json=[1, 2])
+
+    assert invalid.status_code == 400
+    assert invalid.json() == {"detail": "Invalid JSON payload"}
+    assert not_object.status_code == 400
+
+
+def test_health_body_is_cached_until_handlers_change(sdk: KiketSDK):
+    sdk.webhook("issue.created", version="v1")(lambda payload: {"ok": True})
+
+    with TestClient(sdk.app) as client:
+        first = client.get("/health")
+        assert first.json() == {
+            "status": "ok",
+            "extension_id": "ext.test",
+            "extension_version": "1.0.0",
+            "registered_events": ["issue.created@v1"],
+        }
+        assert sdk._health_body() is sdk._health_body()  # noqa: SLF001
+
+        sdk.webhook("issue.updated", version="v1")(lambda payload: {"ok": True})
+        second = client.get("/health")
+
+    assert second.json()["registered_events"] == ["issue.created@v1", "issue.updated@v1"]
@@ -10,19 +10,20 @@ import pytest
 from kiket_sdk import KiketSDK
 
 
+@pytest.fixture(scope="module")
+def sdk() -> KiketSDK:
+    """Create one SDK instance for the module; the helper builder is side-effect free."""
+    return KiketSDK(
+        workspace_token="wk_test",
+        extension_id="ext.test",
+        extension_version="1.0.0",
+        telemetry_enabled=False,
+    )
+
+
 class TestSecretHelper:
     """Tests for the _build_secret_helper method."""
 
-    @pytest.fixture
-    def sdk(self) -> KiketSDK:
-        """Create a basic SDK instance for testing."""
-        return KiketSDK(
-            workspace_token="wk_test",
-            extension_id="ext.test",
-            extension_version="1.0.0",
-            telemetry_enabled=False,
-        )
-
     def test_returns_payload_secret_when_present(self, sdk: KiketSDK) -> None:
         """Payload secrets should be returned when present."""
         payload_secrets = {"SLACK_TOKEN": "payload-token", "API_KEY": "payload-key"}
@@ -1,28 +1,37 @@
 from __future__ import annotations
 
 import datetime as dt
+import json
 
 import httpx
 import pytest
 
-from kiket_sdk.client import KiketClient
 from kiket_sdk.exceptions import SecretStoreError
-from kiket_sdk.secrets import ExtensionSecretManager
+from kiket_sdk.secrets import ExtensionSecretManager, _parse_timestamp
 
 
-class MockTransport(httpx.MockTransport):
-    pass
+@pytest.fixture
+def manager(kiket_client) -> ExtensionSecretManager:
+    return ExtensionSecretManager(kiket_client, "ext.test")
 
 
 def isoformat(dt_obj: dt.datetime) -> str:
     return dt_obj.replace(microsecond=0).isoformat()
 
 
-@pytest.mark.asyncio
-async def test_list_secrets_parses_timestamps():
+def test_parse_timestamp_accepts_utc_shorthand_and_rejects_garbage():
+    parsed = _parse_timestamp("2024-05-01T12:30:00Z")
+
+    assert parsed == dt.datetime(2024, 5, 1, 12, 30, tzinfo=dt.UTC)
+    assert _parse_timestamp("2024-05-01T12:30:00+02:00").utcoffset() == dt.timedelta(hours=2)
+    assert _parse_timestamp("not a timestamp") is None
+    assert _parse_timestamp(None) is None
+
+
+async def test_list_secrets_parses_timestamps(manager, mock_api):
     now = dt.datetime.now(dt.UTC)
 
-    async def handler(request: httpx.Request):
+    def handler(request: httpx.Request):
         assert request.url.path == "/api/v1/extensions/ext.test/secrets"
         payload = [
             {
@@ -33,12 +42,9 @@ async def test_list_secrets_parses_timestamps():
         ]
         return httpx.Response(200, json=payload)
 
-    client = KiketClient("https://example.invalid", "wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    mock_api.handler = handler
 
-    async with client:
-        manager = ExtensionSecretManager(client, "ext.test")
-        secrets = await manager.list()
+    secrets = await manager.list()
 
     assert len(secrets) == 1
     secret = secrets[0]
@@ -47,65 +53,52 @@ async def test_list_secrets_parses_timestamps():
     assert secret.updated_at.tzinfo is not None
 
 
-@pytest.mark.asyncio
-async def test_get_secret_returns_value():
-    async def handler(request: httpx.Request):
+async def test_get_secret_returns_value(manager, mock_api):
+    def handler(request: httpx.Request):
         assert request.url.path == "/api/v1/extensions/ext.test/secrets/API_KEY"
         return httpx.Response(200, json={"key": "API_KEY", "value": "123", "created_at": None, "updated_at": None})
 
-    client = KiketClient("https://example.invalid", "wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    mock_api.handler = handler
 
-    async with client:
-        manager = ExtensionSecretManager(client, "ext.test")
-        secret = await manager.get("API_KEY")
+    secret = await manager.get("API_KEY")
 
     assert secret.value == "123"
 
 
-@pytest.mark.asyncio
-async def test_set_secret_requires_value():
-    client = KiketClient("https://example.invalid", "wk_test")
-    async with client:
-        manager = ExtensionSecretManager(client, "ext.test")
-        with pytest.raises(SecretStoreError):
-            await manager.set("API_KEY", "")
+async def test_set_secret_requires_value(manager, mock_api):
+    with pytest.raises(SecretStoreError):
+        await manager.set("API_KEY", "")
 
+    assert mock_api.requests == []
 
-@pytest.mark.asyncio
-async def test_set_secret_posts_payload():
-    async def handler(request: httpx.Request):
+
+async def test_set_secret_posts_payload(manager, mock_api):
+    def handler(request: httpx.Request):
         assert request.url.path == "/api/v1/extensions/ext.test/secrets"
-        body = httpx.Response(200, content=request.content).json()
+        body = json.loads(request.content)
         assert body == {"secret": {"key": "API_KEY", "value": "123"}}
         return httpx.Response(201, json={"key": "API_KEY"})
 
-    client = KiketClient("https://example.invalid", "wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    mock_api.handler = handler
+
+    await manager.set("API_KEY", "123")
 
-    async with client:
-        manager = ExtensionSecretManager(client, "ext.test")
-        await manager.set("API_KEY", "123")
+    assert len(mock_api.requests) == 1
 
 
-@pytest.mark.asyncio
-async def test_delete_secret_success():
-    async def handler(request: httpx.Request):
+async def test_delete_secret_success(manager, mock_api):
+    def handler(request: httpx.Request):
         assert request.url.path == "/api/v1/extensions/ext.test/secrets/API_KEY"
         return httpx.Response(204)
 
-    client = KiketClient("https://example.invalid", "wk_test")
-    client._client = httpx.AsyncClient(transport=MockTransport(handler), base_url=client.base_url)  # type: ignore[attr-defined]
+    mock_api.handler = handler
+
+    await manager.delete("API_KEY")
 
-    async with client:
-        manager = ExtensionSecretManager(client, "ext.test")
-        await manager.delete("API_KEY")
+    assert mock_api.last_request.method == "DELETE"
 
 
-@pytest.mark.asyncio
-async def test_missing_extension_id_raises():
-    client = KiketClient("https://example.invalid", "wk_test")
-    async with client:
-        manager = ExtensionSecretManager(client)
-        with pytest.raises(SecretStoreError):
-            await manager.list()
+async def test_missing_extension_id_raises(kiket_client):
+    manager = ExtensionSecretManager(kiket_client)
+    with pytest.raises(SecretStoreError):
+        await manager.list()
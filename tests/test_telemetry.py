@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from kiket_sdk.telemetry import TelemetryReporter
+
+
+@pytest.fixture
+def captured(monkeypatch) -> list[httpx.Request]:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(202)
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)
+    )
+    return requests
+
+
+def make_reporter(**kwargs) -> TelemetryReporter:
+    return TelemetryReporter(
+        telemetry_url="https://telemetry.invalid",
+        extension_id="ext.test",
+        extension_version="1.0.0",
+        **kwargs,
+    )
+
+
+async def test_records_are_posted_individually_by_default(captured):
+    reporter = make_reporter()
+
+    await reporter.record("issue.created", "v1", "ok", 1.5, error_message=None)
+
+    assert len(captured) == 1
+    assert str(captured[0].url) == "https://telemetry.invalid/telemetry"
+    assert captured[0].headers["Content-Type"] == "application/json"
+    body = json.loads(captured[0].content)
+    assert body["event"] == "issue.created"
+    assert body["extension_id"] == "ext.test"
+
+
+async def test_batched_records_are_posted_as_gzipped_array(captured):
+    reporter = make_reporter(batch_size=2, flush_interval_ms=60_000)
+
+    await reporter.record("issue.created", "v1", "ok", 1.0)
+    assert captured == []
+
+    await reporter.record("issue.updated", "v1", "error", 2.0, error_class="ValueError")
+
+    assert len(captured) == 1
+    request = captured[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(request.content))
+    assert [item["event"] for item in body["records"]] == ["issue.created", "issue.updated"]
+    assert body["records"][1]["error_class"] == "ValueError"
+
+
+async def test_partial_batch_is_flushed_on_drain(captured):
+    reporter = make_reporter(batch_size=10, flush_interval_ms=60_000, compress=False)
+
+    await reporter.record("issue.created", "v1", "ok", 1.0)
+    await reporter.drain()
+
+    assert len(captured) == 1
+    assert "Content-Encoding" not in captured[0].headers
+    records = json.loads(captured[0].content)["records"]
+    assert [item["event"] for item in records] == ["issue.created"]
+
+
+async def test_partial_batch_is_flushed_after_interval(captured):
+    reporter = make_reporter(batch_size=10, flush_interval_ms=10)
+
+    await reporter.record("issue.created", "v1", "ok", 1.0)
+    assert captured == []
+    await asyncio.sleep(0.05)
+
+    assert len(captured) == 1
+
+
+async def test_posts_reuse_one_pooled_client_until_closed(captured):
+    reporter = make_reporter()
+
+    await reporter.record("issue.created", "v1", "ok", 1.0)
+    client = reporter._http  # noqa: SLF001
+    await reporter.record("issue.updated", "v1", "ok", 1.0)
+
+    assert len(captured) == 2
+    assert client is not None and reporter._http is client  # noqa: SLF001
+
+    await reporter.aclose()
+
+    assert client.is_closed
+    assert reporter._http is None  # noqa: SLF001
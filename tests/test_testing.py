@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+
+from fastapi.testclient import TestClient
+
+from kiket_sdk import KiketSDK
+from kiket_sdk import sdk as sdk_module
+from kiket_sdk.auth import JwtPayload
+from kiket_sdk.testing import replay_payload, webhook_payload_factory
+
+
+def test_payload_factory_signs_each_body_independently():
+    factory = webhook_payload_factory(secret="test")
+
+    for body in ({"event": "issue.created"}, {"event": "issue.updated", "id": 2}):
+        signed = factory(body)
+        expected = hmac.new(b"test", signed["body"].encode(), hashlib.sha256).hexdigest()
+
+        assert json.loads(signed["body"]) == body
+        assert signed["headers"]["X-Kiket-Signature"] == expected
+
+
+def test_payload_factory_without_secret_is_unsigned():
+    signed = webhook_payload_factory()({"event": "issue.created"})
+
+    assert "X-Kiket-Signature" not in signed["headers"]
+    assert signed["headers"]["Content-Type"] == "application/json"
+
+
+def test_replay_payload_can_reuse_a_test_client(tmp_path, monkeypatch):
+    async def fake_verify(payload, base_url):
+        return JwtPayload(sub="ext", scopes=[])
+
+    monkeypatch.setattr(sdk_module, "verify_runtime_token", fake_verify)
+    sdk = KiketSDK(base_url="https://kiket.invalid", telemetry_enabled=False)
+    sdk.webhook("issue.created", version="v1")(lambda payload: {"title": payload["title"]})
+    payload_file = tmp_path / "issue.json"
+    payload_file.write_text(
+        json.dumps({"title": "Café", "authentication": {"runtime_token": "rt"}}),
+        encoding="utf-8",
+    )
+
+    with TestClient(sdk.app) as client:
+        results = [
+            replay_payload(sdk, "issue.created?version=v1", payload_file, client=client)
+            for _ in range(2)
+        ]
+
+    assert results == [{"title": "Café"}] * 2
+
+
+def test_payload_factory_signs_utf8_body_bytes():
+    signed = webhook_payload_factory(secret="test")({"title": "Café"})
+    expected = hmac.new(b"test", signed["body"].encode("utf-8"), hashlib.sha256).hexdigest()
+
+    assert json.loads(signed["body"]) == {"title": "Café"}
+    assert signed["headers"]["X-Kiket-Signature"] == expected